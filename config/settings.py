@@ -25,6 +25,10 @@ def _config_path() -> Path:
     return _config_dir() / "settings.json"
 
 
+def integration_cache_path() -> Path:
+    return _config_dir() / "integration_cache.json"
+
+
 @dataclass
 class Settings:
     p4port: str = DEFAULT_P4PORT
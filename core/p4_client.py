@@ -4,14 +4,39 @@ Centralized Perforce subprocess access.
 
 from __future__ import annotations
 
+import io
+import marshal
+import os
 import re
 import subprocess
+import threading
 from dataclasses import dataclass
 from typing import Any
 
 from config.settings import Settings, load_settings
 
 
+# Commands run as argv lists without a shell; on Windows also suppress the
+# console window each p4 process would otherwise flash
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+# Upper bound on concurrent p4 processes when callers fan out on threads
+MAX_CONCURRENT_P4 = 4
+_P4_PROCESS_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_P4)
+
+
+def _run_p4_process(cmd: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    with _P4_PROCESS_SLOTS:
+        return subprocess.run(cmd, creationflags=_CREATION_FLAGS, **kwargs)
+
+
+# Left-hand side of each indented mapping line in a spec's View section, either
+# quoted (paths with spaces) or a single token; may carry a "-" or "+" prefix
+_VIEW_LEFT_RE = re.compile(r'^[ \t]+(?:"([^"]+)"|(\S+))', re.MULTILINE)
+# Start of the next top-level spec field, which ends the View section
+_SPEC_FIELD_RE = re.compile(r"^\S", re.MULTILINE)
+
+
 @dataclass
 class P4CommandError(RuntimeError):
     command: list[str]
@@ -32,41 +57,52 @@ class P4CommandError(RuntimeError):
 class P4Client:
     def __init__(self, settings: Settings | None = None):
         self.settings = settings or load_settings()
+        self._env: dict[str, str] | None = None
 
     def _build_env(self) -> dict[str, str]:
-        return self.settings.p4_env()
+        # Built once per client; copying os.environ on every command adds up
+        if self._env is None:
+            self._env = self.settings.p4_env()
+        return self._env
 
     def run(
         self,
         args: list[str],
         input_text: str | None = None,
         check: bool = True,
+        discard_stdout: bool = False,
     ) -> str:
         cmd = ["p4", *args]
-        result = subprocess.run(
+        if discard_stdout:
+            # Only stderr is kept; large outputs (e.g. sync) never reach Python
+            output_kwargs = {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE}
+        else:
+            output_kwargs = {"capture_output": True}
+        result = _run_p4_process(
             cmd,
             input=input_text,
-            capture_output=True,
             text=True,
             env=self._build_env(),
             encoding="utf-8",
             errors="replace",
+            **output_kwargs,
         )
+        stdout = (result.stdout or "").strip()
         if check and result.returncode != 0:
             raise P4CommandError(
                 command=cmd,
                 returncode=result.returncode,
-                stdout=result.stdout.strip(),
-                stderr=result.stderr.strip(),
+                stdout=stdout,
+                stderr=(result.stderr or "").strip(),
             )
-        return result.stdout.strip()
+        return stdout
 
     def run_with_result(
         self,
         args: list[str],
         input_text: str | None = None,
     ) -> subprocess.CompletedProcess[str]:
-        return subprocess.run(
+        return _run_p4_process(
             ["p4", *args],
             input=input_text,
             capture_output=True,
@@ -76,6 +112,62 @@ class P4Client:
             errors="replace",
         )
 
+    def run_marshalled(
+        self,
+        args: list[str],
+        arg_lines: list[str] | None = None,
+    ) -> list[dict[str, str]]:
+        """Run a command with ``p4 -G`` and return its decoded records.
+
+        When ``arg_lines`` is given they are fed to ``-x -`` so the command is
+        applied to every argument inside a single p4 process.
+        """
+        cmd = ["p4", "-G"]
+        stdin_bytes = None
+        if arg_lines is not None:
+            cmd.extend(["-x", "-"])
+            stdin_bytes = "\n".join(arg_lines).encode("utf-8")
+        cmd.extend(args)
+        result = _run_p4_process(
+            cmd,
+            input=stdin_bytes,
+            capture_output=True,
+            env=self._build_env(),
+        )
+        records: list[dict[str, str]] = []
+        stream = io.BytesIO(result.stdout)
+        while True:
+            try:
+                record = marshal.load(stream)
+            except (EOFError, ValueError, TypeError):
+                break
+            records.append(self._decode_record(record))
+        return records
+
+    def files_many(self, depot_paths: list[str]) -> dict[str, bool]:
+        """Return existence of each depot path using one batched ``p4 files``.
+
+        The server reports files under their canonical depot path, which can
+        differ from the argument (case, wildcards, revision specs). Paths that
+        are neither matched exactly nor reported missing are checked with
+        ``files`` one at a time.
+        """
+        if not depot_paths:
+            return {}
+        records = self.run_marshalled(["files"], arg_lines=list(depot_paths))
+        found = set()
+        missing = set()
+        for record in records:
+            if record.get("code") == "stat":
+                found.add(record.get("depotFile"))
+            elif "no such file" in record.get("data", ""):
+                missing.add(record["data"].split(" - ", 1)[0])
+        return {
+            depot_path: depot_path in found
+            or (depot_path not in missing and self.files(depot_path))
+            for depot_path in depot_paths
+        }
+
     def files(self, depot_path: str) -> bool:
         result = self.run_with_result(["files", depot_path])
         if result.returncode != 0:
@@ -87,22 +179,35 @@ class P4Client:
         return True
 
     def sync(self, depot_path: str) -> None:
-        self.run(["sync", depot_path])
+        self.run(["sync", depot_path], discard_stdout=True)
+
+    def sync_many(self, depot_paths: list[str]) -> None:
+        self.run(["sync", *depot_paths], discard_stdout=True)
 
     def edit(self, depot_path: str, changelist_id: str) -> None:
-        self.run(["edit", "-c", str(changelist_id), depot_path])
+        self.run(["edit", "-c", str(changelist_id), depot_path], discard_stdout=True)
 
     def reopen(self, depot_path: str, changelist_id: str) -> None:
-        self.run(["reopen", "-c", str(changelist_id), depot_path])
+        self.run(["reopen", "-c", str(changelist_id), depot_path], discard_stdout=True)
 
     def add(self, depot_path: str, changelist_id: str) -> None:
-        self.run(["add", "-c", str(changelist_id), depot_path])
+        self.run(["add", "-c", str(changelist_id), depot_path], discard_stdout=True)
 
     def opened(self, depot_path: str) -> subprocess.CompletedProcess[str]:
         return self.run_with_result(["opened", depot_path])
 
     def filelog(self, depot_path: str) -> str:
-        return self.run(["filelog", "-i", depot_path])
+        return self.run(["filelog", "-m", "1", "-i", depot_path])
+
+    def filelog_records(self, depot_path: str) -> list[dict[str, str]]:
+        """Return ``p4 -G filelog -m 1 -i`` records; integrations are keyed ``how<rev>,<n>``."""
+        return self.run_marshalled(["filelog", "-m", "1", "-i", depot_path])
+
+    def filelog_records_many(self, depot_paths: list[str]) -> list[dict[str, str]]:
+        """Return one ``p4 -G filelog -m 1`` record per path from a single p4 process."""
+        if not depot_paths:
+            return []
+        return self.run_marshalled(["filelog", "-m", "1"], arg_lines=list(depot_paths))
 
     def create_changelist(self, description: str) -> str:
         changelist_spec = self.run(["change", "-o"])
@@ -128,11 +233,35 @@ class P4Client:
         spec_text = self.run(args)
         return self._parse_spec(spec_text)
 
+    def fetch_view_depots(self, workspace: str | None = None) -> list[str]:
+        """Return the depot (left) side of every View mapping of a client spec.
+
+        Quotes and the "+" overlay prefix are stripped. "-" exclusion lines are
+        skipped, since the paths they name are not part of the workspace.
+        """
+        args = ["client", "-o"]
+        if workspace:
+            args.append(workspace)
+        spec_text = self.run(args)
+        start = spec_text.find("\nView:\n")
+        if start < 0:
+            return []
+        start += len("\nView:\n")
+        next_field = _SPEC_FIELD_RE.search(spec_text, start)
+        end = next_field.start() if next_field else len(spec_text)
+        depots = []
+        for quoted, plain in _VIEW_LEFT_RE.findall(spec_text, start, end):
+            left = quoted or plain
+            if left.startswith("-"):
+                continue
+            depots.append(left.lstrip("+"))
+        return depots
+
     def client_spec_text(self) -> str:
         return self.run(["client", "-o"])
 
     def update_client_spec(self, spec_text: str) -> None:
-        self.run(["client", "-i"], input_text=spec_text)
+        self.run(["client", "-i"], input_text=spec_text, discard_stdout=True)
 
     def login_status(self) -> subprocess.CompletedProcess[str]:
         return self.run_with_result(["login", "-s"])
@@ -141,7 +270,7 @@ class P4Client:
         return self.run_with_result(["login"], input_text=password)
 
     def set_variable(self, key: str, value: str) -> None:
-        subprocess.run(
+        _run_p4_process(
             ["p4", "set", f"{key}={value}"],
             check=True,
             capture_output=True,
@@ -151,7 +280,7 @@ class P4Client:
         )
 
     def set_output(self) -> str:
-        result = subprocess.run(
+        result = _run_p4_process(
             ["p4", "set"],
             capture_output=True,
             text=True,
@@ -167,6 +296,15 @@ class P4Client:
         args.extend(["-u", username, "clients", "-u", username])
         return self.run(args)
 
+    @staticmethod
+    def _decode_record(record: dict[Any, Any]) -> dict[str, str]:
+        def _text(value: Any) -> Any:
+            if isinstance(value, bytes):
+                return value.decode("utf-8", errors="replace")
+            return value
+
+        return {_text(key): _text(value) for key, value in record.items()}
+
     @staticmethod
     def _parse_spec(spec_text: str) -> dict[str, Any]:
         parsed: dict[str, Any] = {}
@@ -189,10 +327,13 @@ class P4Client:
 
 
 _DEFAULT_CLIENT: P4Client | None = None
+_DEFAULT_CLIENT_LOCK = threading.Lock()
 
 
 def get_default_p4_client() -> P4Client:
     global _DEFAULT_CLIENT
     if _DEFAULT_CLIENT is None:
-        _DEFAULT_CLIENT = P4Client()
+        with _DEFAULT_CLIENT_LOCK:
+            if _DEFAULT_CLIENT is None:
+                _DEFAULT_CLIENT = P4Client()
     return _DEFAULT_CLIENT
@@ -4,77 +4,129 @@ Handles all Perforce commands and validations
 Enhanced with auto-resolve cascading functionality - FIXED VERSION
 """
 
+import atexit
+import json
 import re
 import shlex
-from typing import List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from config.p4_config import get_client_name
+from config.settings import integration_cache_path
 from core.p4_client import get_default_p4_client
 
 # Export the function for use by other modules
 __all__ = [
     "get_client_name",
     "run_cmd",
+    "run_cmd_silent",
+    "p4_run",
     "validate_depot_path",
+    "validate_depot_paths_bulk",
     "validate_device_common_mk_path",
     "create_changelist_silent",
     "map_client_two_paths",
     "map_single_depot",
     "map_two_depots_silent",
+    "map_and_sync",
     "sync_file_silent",
     "checkout_file_silent",
     "is_workspace_like",
+    "InputKind",
+    "classify_input",
     "resolve_user_input_to_depot_path",
     "auto_resolve_missing_branches",
     "get_integration_source_depot_path",
+    "get_integration_sources_bulk",
+    "clear_integration_cache",
+    "flush_integration_cache",
+    "reset_p4_caches",
     "find_device_common_mk_path"
 ]
 
 
+_VIEW_DEVICE_COMMON_RE = re.compile(r"/device/[^/]+?_common/")
+
+
+def _log(log_callback, fmt, *args):
+    """Format and emit a log line only when someone is listening"""
+    if log_callback is None:
+        return
+    log_callback(fmt % args if args else fmt)
+
+
+def _log_branches(log_callback, tag, branches: "Branches", missing):
+    """Log the four branch values as one multi-line message"""
+    _log(
+        log_callback,
+        "[%s] VINCE: %s\n[%s] BENI: %s\n[%s] FLUMEN: %s\n[%s] REL: %s",
+        tag, branches.vince,
+        tag, branches.beni or missing,
+        tag, branches.flumen or missing,
+        tag, branches.rel or missing,
+    )
+
+
+@lru_cache(maxsize=64)
+def _find_device_common_cached(workspace_name):
+    """Resolve a workspace's device_common.mk path and view depots, once per session"""
+    all_view_paths = get_default_p4_client().fetch_view_depots(workspace_name)
+
+    # Look for device/*_common/ pattern - only the first match is used
+    device_common_path = None
+    for depot_path in all_view_paths:
+        if _VIEW_DEVICE_COMMON_RE.search(depot_path):
+            # Remove the trailing "..." wildcard and add "device_common.mk"
+            clean_path = depot_path[:-3] if depot_path.endswith("...") else depot_path
+            if not clean_path.endswith("/"):
+                clean_path += "/"
+            device_common_path = clean_path + "device_common.mk"
+            break
+
+    return device_common_path, tuple(all_view_paths)
+
+
 def find_device_common_mk_path(workspace_name, log_callback=None):
     """
-    Find device_common.mk path from workspace using P4Python
+    Find device_common.mk path from workspace through the shared P4 client
     Returns the complete depot path to device_common.mk file and all view paths
+    Results are cached per workspace name until reset_p4_caches()
     """
-    if log_callback:
-        log_callback(f"[SYSTEM] Searching device_common.mk in workspace: {workspace_name}")
-    
+    _log(log_callback, "[SYSTEM] Searching device_common.mk in workspace: %s", workspace_name)
+
     try:
-        client_spec = get_default_p4_client().fetch_client_spec(workspace_name)
-        
-        # Search in View mappings for device_common.mk pattern
-        device_common_paths = []
-        all_view_paths = []  # Store all paths for later use
-        
-        for view in client_spec.get('View', []):
-            # Get depot path (left side of mapping)
-            depot_path = view.split()[0] if isinstance(view, str) else view[0]
-            all_view_paths.append(depot_path)
-            
-            # Look for device/*_common/ pattern
-            if re.search(r'/device/[^/]+?_common/', depot_path):
-                # Remove "..." and add "device_common.mk"
-                clean_path = depot_path.rstrip('...')
-                device_common_path = clean_path + "device_common.mk"
-                device_common_paths.append(device_common_path)
-        
-        if log_callback:
-            if device_common_paths:
-                log_callback(f"[OK] Found device_common.mk path: {device_common_paths[0]}")
-            else:
-                log_callback("[WARNING] No device_common.mk path found in workspace")
-        
-        return device_common_paths[0] if device_common_paths else None, all_view_paths
-        
+        device_common_path, all_view_paths = _find_device_common_cached(workspace_name)
     except Exception as e:
         error_msg = f"P4 Error: {str(e)}"
-        if log_callback:
-            log_callback(f"[ERROR] {error_msg}")
+        _log(log_callback, "[ERROR] %s", error_msg)
         raise RuntimeError(error_msg)
 
-def run_cmd(cmd, input_text=None):
-    """Execute command and return output"""
+    if device_common_path:
+        _log(log_callback, "[OK] Found device_common.mk path: %s", device_common_path)
+    else:
+        _log(log_callback, "[WARNING] No device_common.mk path found in workspace")
+
+    return device_common_path, list(all_view_paths)
+
+
+def run_cmd(cmd, input_text=None, discard_stdout=False):
+    """Execute command and return output (empty when discard_stdout is set)
+
+    `cmd` is an argv list such as ["p4", "files", depot_path]; plain strings are
+    still accepted and split for backward compatibility. No shell is involved.
+    """
     args = _parse_p4_command(cmd)
-    return get_default_p4_client().run(args, input_text=input_text)
+    return get_default_p4_client().run(
+        args, input_text=input_text, discard_stdout=discard_stdout
+    )
+
+
+def run_cmd_silent(cmd, input_text=None):
+    """Execute command for its side effect only; stdout is never read into memory"""
+    run_cmd(cmd, input_text=input_text, discard_stdout=True)
 
 
 def _parse_p4_command(cmd):
@@ -89,12 +141,49 @@ def _parse_p4_command(cmd):
     return parts
 
 
+def p4_run(cmd, *args):
+    """Run a P4 command through the shared client and return its tagged records"""
+    return get_default_p4_client().run_marshalled([cmd, *args])
+
+
+# depot path -> exists, kept for the current UI action; see reset_p4_caches()
+_VALIDATE_CACHE: Dict[str, bool] = {}
+
+
 def validate_depot_path(depot_path):
     """Validate if depot path exists in Perforce"""
+    if depot_path in _VALIDATE_CACHE:
+        return _VALIDATE_CACHE[depot_path]
     try:
-        return get_default_p4_client().files(depot_path)
+        exists = any(record.get("code") == "stat" for record in p4_run("files", depot_path))
     except Exception:
         return False
+    _VALIDATE_CACHE[depot_path] = exists
+    return exists
+
+
+def validate_depot_paths_bulk(depot_paths):
+    """
+    Validate several depot paths with a single P4 call
+    Returns {depot_path: exists}; empty entries are ignored
+    Only paths found to exist are cached: a batched miss is not as reliable as a
+    single lookup, so validate_depot_path checks it again by itself
+    """
+    unique_paths = list(dict.fromkeys(path for path in depot_paths if path))
+    if not unique_paths:
+        return {}
+    results = {path: _VALIDATE_CACHE[path] for path in unique_paths if path in _VALIDATE_CACHE}
+    unknown = [path for path in unique_paths if path not in results]
+    if unknown:
+        try:
+            existing = get_default_p4_client().files_many(unknown)
+        except Exception:
+            existing = {}
+        for path in unknown:
+            results[path] = exists = existing.get(path, False)
+            if exists:
+                _VALIDATE_CACHE[path] = True
+    return {path: results[path] for path in unique_paths}
 
 
 def validate_device_common_mk_path(depot_path):
@@ -102,12 +191,10 @@ def validate_device_common_mk_path(depot_path):
     Validate if depot path exists and is a device_common.mk file
     Returns (exists, is_device_common_mk)
     """
-    try:
-        if not get_default_p4_client().files(depot_path):
-            return False, False
-        return True, depot_path.endswith("/device_common.mk")
-    except Exception:
+    # Shares the per-action existence cache with validate_depot_path
+    if not validate_depot_path(depot_path):
         return False, False
+    return True, depot_path.endswith("/device_common.mk")
 
 
 
@@ -116,25 +203,28 @@ def create_changelist_silent(description="Auto changelist"):
     """Create pending changelist with template + dynamic description appended to [Title]"""
     return get_default_p4_client().create_changelist(description)
 
-    # Get changelist template
-    changelist_spec = run_cmd("p4 change -o")
-    
-    # Parse changelist spec và append description sau [Title]
-    lines = changelist_spec.split('\n')
-    new_lines = []
-    
-    for line in lines:
-        # Tìm [Title] và append description
-        if line.strip() == "[Title]":
-            new_lines.append(f"\t[Title] {description}")
-        else:
-            # Giữ nguyên tất cả các line khác
-            new_lines.append(line)
-    
-    new_spec = '\n'.join(new_lines)
-    changelist_result = run_cmd("p4 change -i", input_text=new_spec)
-    changelist_id = re.search(r"Change (\d+)", changelist_result).group(1)
-    return changelist_id
+
+_DEPOT_LABELS = re.compile(r"(beni|flumen)", re.IGNORECASE)
+
+
+def _label(depot_path, default):
+    """Return BENI/FLUMEN if the depot path mentions that branch, else default"""
+    match = _DEPOT_LABELS.search(depot_path)
+    return match.group(1).upper() if match else default
+
+
+# Client spec rewrites must not interleave when cascade steps run concurrently
+_CLIENT_SPEC_LOCK = threading.Lock()
+
+# Worker threads used by auto-resolve for independent P4 steps
+_AUTO_RESOLVE_WORKERS = 4
+
+# Mapping log message per known call shape (single depot, target + VINCE, all four)
+_MAPPING_MESSAGES = {
+    1: lambda paths: f"[MAPPING] Mapping {_label(paths[0], 'DEPOT')} to client spec...",
+    2: lambda paths: f"[STEP 2] Mapping {_label(paths[0], 'TARGET')} and VINCE to client spec...",
+    4: lambda paths: "[STEP 2] Mapping BENI, VINCE, FLUMEN and REL to client spec...",
+}
 
 
 def _map_client_depots_core(depot_paths, log_callback=None, silent=False):
@@ -154,38 +244,40 @@ def _map_client_depots_core(depot_paths, log_callback=None, silent=False):
         raise RuntimeError("Client name not initialized. Please check P4 configuration.")
     
     # Build mapping line for each depot
-    mapping_lines = []
-    for depot_path in depot_paths:
-        mapping_lines.append(f"\t{depot_path}\t//{client_name}/{depot_path[2:]}")
+    prefix = f"//{client_name}/"
+    mapping_lines = [f"\t{depot}\t{prefix}{depot[2:]}" for depot in depot_paths]
     
-    # Get current client spec
-    client_spec = run_cmd("p4 client -o")
-    lines = client_spec.splitlines()
-    
-    # Remove old mappings for any target depot
-    new_lines = []
-    for line in lines:
-        if any(depot in line for depot in depot_paths):
-            continue  # Remove old mapping
-        new_lines.append(line)
-    
-    # Add new mappings
-    new_lines.extend(mapping_lines)
-    
-    # Update client spec
-    new_spec = "\n".join(new_lines)
-    run_cmd("p4 client -i", input_text=new_spec)
+    # Get current client spec; read-modify-write is serialized across threads
+    with _CLIENT_SPEC_LOCK:
+        client_spec = run_cmd(["p4", "client", "-o"])
+        
+        # Remove old mappings for any target depot, then add new mappings
+        new_lines = []
+        replaced_lines = []
+        for line in client_spec.splitlines():
+            if any(depot in line for depot in depot_paths):
+                replaced_lines.append(line)
+            else:
+                new_lines.append(line)
+        
+        # Update client spec, unless it already ends with exactly these mappings.
+        # Views are order-sensitive: a mapping followed by a later exclusion or
+        # overlapping line must be moved back to the end
+        wanted = [line.split() for line in mapping_lines]
+        view_tail = client_spec.rstrip().splitlines()[-len(mapping_lines):]
+        already_mapped = (
+            [line.split() for line in replaced_lines] == wanted
+            and [line.split() for line in view_tail] == wanted
+        )
+        if not already_mapped:
+            new_spec = "\n".join(new_lines + mapping_lines)
+            run_cmd_silent(["p4", "client", "-i"], input_text=new_spec)
     
     # Logging only if not silent
     if not silent and log_callback:
-        if len(depot_paths) == 1:
-            depot_name = "BENI" if "beni" in depot_paths[0].lower() else "FLUMEN" if "flumen" in depot_paths[0].lower() else "DEPOT"
-            log_callback(f"[MAPPING] Mapping {depot_name} to client spec...")
-        elif len(depot_paths) == 2:
-            target_name = "BENI" if "beni" in depot_paths[0].lower() else "FLUMEN" if "flumen" in depot_paths[0].lower() else "TARGET"
-            log_callback(f"[STEP 2] Mapping {target_name} and VINCE to client spec...")
-        elif len(depot_paths) == 4:
-            log_callback("[STEP 2] Mapping BENI, VINCE, FLUMEN and REL to client spec...")
+        build_message = _MAPPING_MESSAGES.get(len(depot_paths))
+        if build_message:
+            log_callback(build_message(depot_paths))
         
         log_callback("[OK] Mapping completed.")
 
@@ -209,6 +301,25 @@ def sync_file_silent(depot_path):
     """Sync file from depot without logging"""
     get_default_p4_client().sync(depot_path)
 
+
+def _cascade_apply(depot_paths, log_callback=None):
+    """
+    Map and sync depot paths as one batch - INTERNAL USE ONLY
+
+    The client spec is rewritten once for all paths, followed by a single `p4 sync`.
+    """
+    depot_paths = list(dict.fromkeys(path for path in depot_paths if path))
+    if not depot_paths:
+        return
+    _map_client_depots_core(depot_paths, log_callback, silent=log_callback is None)
+    get_default_p4_client().sync_many(depot_paths)
+
+
+def map_and_sync(depot_path, log_callback=None):
+    """Map depot to client spec (rewritten only when its mapping changes) and sync it"""
+    _cascade_apply([depot_path], log_callback=log_callback)
+
+
 def checkout_file_silent(
     depot_path,
     changelist_id,
@@ -302,29 +413,63 @@ def checkout_file_silent(
 # Workspace helpers (accept TEMPLATE_* workspace name and resolve to depot file path)
 # =====================================================================================
 
-_DEVICE_COMMON_REGEX = re.compile(r"^(.+?)/device/([^/]+?)_common/", re.IGNORECASE)
+_DEVICE_COMMON_REGEX = re.compile(
+    r"\A(?P<vendor_dir>.+?)/device/(?P<model>[^/]+?)_common/", re.IGNORECASE
+)
+# Cheap substring pre-filter so most view lines never reach the regex engine
+_DEVICE_SEGMENT = "/device/"
+
+
+class InputKind(IntEnum):
+    """Kind of a user-supplied branch input."""
+
+    LITERAL = 0
+    DEPOT = 1
+    WORKSPACE = 2
+
+
+def classify_input(user_input: str) -> InputKind:
+    """Classify input as a depot path, a TEMPLATE_* workspace, or anything else."""
+    if not user_input:
+        return InputKind.LITERAL
+    text = user_input.strip()
+    if text.startswith("//"):
+        return InputKind.DEPOT
+    if text[:8].upper() == "TEMPLATE":
+        return InputKind.WORKSPACE
+    return InputKind.LITERAL
 
 
 def is_workspace_like(user_input: str) -> bool:
     """Return True if the input string looks like a P4 workspace template name."""
-    if not user_input:
-        return False
-    return user_input.strip().upper().startswith("TEMPLATE")
+    return classify_input(user_input) is InputKind.WORKSPACE
 
 def _extract_device_common_from_depots(left_depots: List[str]) -> Optional[str]:
     """From a list of left depot mappings, find a `device/<model>_common/` segment and
     build the device_common.mk depot file path."""
+    candidates = []
     for left in left_depots:
-        match = _DEVICE_COMMON_REGEX.search(left)
+        if _DEVICE_SEGMENT not in left.lower():
+            continue
+        match = _DEVICE_COMMON_REGEX.match(left)
         if not match:
             continue
-        base_vendor_dir = match.group(1)
+        base_vendor_dir = match.group("vendor_dir")
         last_segment = base_vendor_dir.rstrip("/").split("/")[-1]
         model = last_segment.split("_")[0] if "_" in last_segment else last_segment
         candidate = f"{base_vendor_dir}/device/{model}_common/device_common.mk"
-        if validate_depot_path(candidate):
-            return candidate
-    return None
+        if candidate not in candidates:
+            candidates.append(candidate)
+    if not candidates:
+        return None
+
+    # Validate every candidate in a single p4 process instead of one per candidate
+    try:
+        existing = get_default_p4_client().files_many(candidates)
+    except Exception:
+        return None
+    return next((candidate for candidate in candidates if existing.get(candidate)), None)
+
 
 def resolve_user_input_to_depot_path(user_input: str) -> str:
     """Normalize user input: if it's a depot path, return as-is; if it's a workspace,
@@ -333,10 +478,9 @@ def resolve_user_input_to_depot_path(user_input: str) -> str:
     if not user_input:
         return user_input
     text = user_input.strip()
-    if text.startswith("//"):
-        return text
-    if is_workspace_like(text):
-        return find_device_common_mk_path(text)
+    if classify_input(text) is InputKind.WORKSPACE:
+        device_common_path, _ = find_device_common_mk_path(text)
+        return device_common_path
     return text
 
 
@@ -345,42 +489,256 @@ def resolve_user_input_to_depot_path(user_input: str) -> str:
 # =====================================================================================
 
 
+# "... ... branch from //path/device_common.mk#1,#3" -> "//path/device_common.mk"
+_BRANCH_FROM_RE = re.compile(r"^[ \t]*\.\.\. \.\.\. branch from (//[^#,\r\n]+)", re.MULTILINE)
+
+# depot path -> integration source of its revision #1 (None when it has none)
+_INTEGRATION_SRC_CACHE: Dict[str, Optional[str]] = {}
+
+
+# Positive lookups persisted across runs; loaded lazily on first lookup, kept
+# in least-recently-added order and written back by flush_integration_cache()
+_PERSISTED_INTEGRATION_SRC: Optional[Dict[str, str]] = None
+_PERSISTED_INTEGRATION_DIRTY = False
+_PERSISTED_INTEGRATION_LOCK = threading.Lock()
+# Oldest entries are dropped beyond this many persisted lookups
+_PERSISTED_INTEGRATION_MAX = 1000
+
+
+def clear_integration_cache():
+    """Forget cached integration sources so the next lookup queries P4 again"""
+    global _PERSISTED_INTEGRATION_SRC, _PERSISTED_INTEGRATION_DIRTY
+    _INTEGRATION_SRC_CACHE.clear()
+    with _PERSISTED_INTEGRATION_LOCK:
+        _PERSISTED_INTEGRATION_SRC = {}
+        _PERSISTED_INTEGRATION_DIRTY = False
+        _write_persisted_integration_sources({})
+
+
+def flush_integration_cache():
+    """Write integration sources learned since the last flush to disk"""
+    global _PERSISTED_INTEGRATION_DIRTY
+    with _PERSISTED_INTEGRATION_LOCK:
+        if not _PERSISTED_INTEGRATION_DIRTY or _PERSISTED_INTEGRATION_SRC is None:
+            return
+        _write_persisted_integration_sources(dict(_PERSISTED_INTEGRATION_SRC))
+        _PERSISTED_INTEGRATION_DIRTY = False
+
+
+atexit.register(flush_integration_cache)
+
+
+def reset_p4_caches():
+    """
+    Drop per-action P4 lookups (path existence, workspace views) so a new UI
+    action sees fresh server state.
+    Integration sources are kept for the whole session since revision #1 history
+    is immutable; clear_integration_cache() is the explicit refresh for those
+    """
+    _VALIDATE_CACHE.clear()
+    _find_device_common_cached.cache_clear()
+
+
+def _persisted_integration_sources() -> Dict[str, str]:
+    """Load the on-disk integration source cache once per process"""
+    global _PERSISTED_INTEGRATION_SRC
+    with _PERSISTED_INTEGRATION_LOCK:
+        if _PERSISTED_INTEGRATION_SRC is None:
+            try:
+                payload = json.loads(integration_cache_path().read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                payload = {}
+            entries = [
+                (key, value)
+                for key, value in payload.items()
+                if isinstance(key, str) and isinstance(value, str)
+            ] if isinstance(payload, dict) else []
+            _PERSISTED_INTEGRATION_SRC = dict(entries[-_PERSISTED_INTEGRATION_MAX:])
+        return _PERSISTED_INTEGRATION_SRC
+
+
+def _write_persisted_integration_sources(sources: Dict[str, str]):
+    try:
+        path = integration_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(sources, indent=2), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _remember_integration_source(depot_path: str, source_path: str):
+    """Record a positive lookup in memory; flush_integration_cache() persists it"""
+    global _PERSISTED_INTEGRATION_DIRTY
+    persisted = _persisted_integration_sources()
+    with _PERSISTED_INTEGRATION_LOCK:
+        if persisted.get(depot_path) == source_path:
+            return
+        persisted.pop(depot_path, None)
+        persisted[depot_path] = source_path
+        while len(persisted) > _PERSISTED_INTEGRATION_MAX:
+            del persisted[next(iter(persisted))]
+        _PERSISTED_INTEGRATION_DIRTY = True
+
+
+def _branch_source_from_record(record: Dict[str, str]) -> Optional[str]:
+    """Return the first "branch from" source of the newest revision in a -G filelog record"""
+    index = 0
+    while f"how0,{index}" in record:
+        if record[f"how0,{index}"] == "branch from":
+            return record.get(f"file0,{index}")
+        index += 1
+    return None
+
+
+def _store_integration_source(depot_path, record, log_callback) -> Optional[str]:
+    """Extract, log and cache the integration source from a -G filelog record"""
+    source_path = _branch_source_from_record(record)
+    if source_path:
+        _log(log_callback, "[PARSE] Extracted integration source: %s", source_path)
+        _INTEGRATION_SRC_CACHE[depot_path] = source_path
+        _remember_integration_source(depot_path, source_path)
+        return source_path
+    _log(log_callback, "[WARNING] No 'branch from' entry in filelog for %s#1", depot_path)
+    _INTEGRATION_SRC_CACHE[depot_path] = None
+    return None
+
+
 def get_integration_source_depot_path(depot_path: str, log_callback) -> Optional[str]:
     """
     FIXED: Get integration source depot path from p4 filelog version #1
     Parse integration history and return source depot path from "branch from" line
     Returns None if no integration source found or parsing failed
+    Results are cached per depot path; failed lookups are not cached
+    Found sources are also persisted to disk and reused by later runs
     """
+    if depot_path in _INTEGRATION_SRC_CACHE:
+        source_path = _INTEGRATION_SRC_CACHE[depot_path]
+        _log(log_callback, "[CACHE] Integration source for %s#1: %s", depot_path, source_path or "(none)")
+        return source_path
+
+    # Revision #1 history never changes, so a source found on a previous run still holds
+    source_path = _persisted_integration_sources().get(depot_path)
+    if source_path:
+        _INTEGRATION_SRC_CACHE[depot_path] = source_path
+        _log(log_callback, "[CACHE] Integration source for %s#1: %s", depot_path, source_path)
+        return source_path
+
     try:
-        output = get_default_p4_client().filelog(f"{depot_path}#1")
+        client = get_default_p4_client()
+
+        # Tagged output already splits integrations into fields, no text parsing needed
+        records = client.filelog_records(f"{depot_path}#1")
+        stat_records = [record for record in records if record.get("code") == "stat"]
+        if stat_records:
+            return _store_integration_source(depot_path, stat_records[0], log_callback)
+        if records:
+            # Error records only (e.g. no such file); report them like a failed command
+            raise RuntimeError(records[0].get("data", "").strip() or "filelog failed")
+
+        # No tagged output at all; fall back to the plain text report
+        output = client.filelog(f"{depot_path}#1")
         if not output:
-            if log_callback:
-                log_callback(f"[WARNING] Empty filelog output for {depot_path}#1")
+            _log(log_callback, "[WARNING] Empty filelog output for %s#1", depot_path)
+            _INTEGRATION_SRC_CACHE[depot_path] = None
             return None
 
         # FIXED PARSING: Look for "... ... branch from <path>#<version>" pattern
-        lines = output.split("\n")
-        for line in lines:
-            line = line.strip()
-            if line.startswith("... ... branch from "):
-                # Extract path from "... ... branch from //path/device_common.mk#1"
-                # Remove "... ... branch from " prefix and "#<version>" suffix
-                integration_line = line.split("from ")[1]
-                source_path = integration_line.split("#")[0].split(",")[0]
-                if log_callback:
-                    log_callback(f"[PARSE] Extracted integration source: {source_path}")
-                return source_path
-
-        if log_callback:
-            log_callback(
-                f"[WARNING] No 'branch from' line found in filelog output for {depot_path}#1"
-            )
+        match = _BRANCH_FROM_RE.search(output)
+        if match:
+            source_path = match.group(1)
+            _log(log_callback, "[PARSE] Extracted integration source: %s", source_path)
+            _INTEGRATION_SRC_CACHE[depot_path] = source_path
+            _remember_integration_source(depot_path, source_path)
+            return source_path
+
+        _log(
+            log_callback,
+            "[WARNING] No 'branch from' line found in filelog output for %s#1",
+            depot_path,
+        )
+        _INTEGRATION_SRC_CACHE[depot_path] = None
         return None
 
     except Exception as e:
-        if log_callback:
-            log_callback(f"[ERROR] Error getting integration source: {str(e)}")
+        _log(log_callback, "[ERROR] Error getting integration source: %s", e)
+        return None
+
+@dataclass
+class Branches:
+    """Normalized VINCE/BENI/FLUMEN/REL inputs of one auto-resolve request"""
+    vince: str = ""
+    beni: str = ""
+    flumen: str = ""
+    rel: str = ""
+
+    @classmethod
+    def from_inputs(cls, vince, beni, flumen, rel) -> "Branches":
+        return cls(*[value.strip() if value else "" for value in (vince, beni, flumen, rel)])
+
+
+# Integration order of the branches: each one is branched from the next
+BRANCH_CHAIN = ("rel", "flumen", "beni")
+
+
+def _cascade_seed(branches: Branches) -> Optional[str]:
+    """Return the last given branch of BRANCH_CHAIN when later ones are missing"""
+    given = [name for name in BRANCH_CHAIN if getattr(branches, name)]
+    if not given or given[-1] == BRANCH_CHAIN[-1]:
         return None
+    return given[-1]
+
+
+def get_integration_sources_bulk(depot_paths, log_callback=None) -> Dict[str, Optional[str]]:
+    """
+    Get integration sources of several independent depot paths with one p4 filelog
+    Known paths are answered from the cache; paths missing from the batched
+    output fall back to get_integration_source_depot_path, which reports errors
+    Returns {depot_path: source or None}; empty entries are ignored
+    """
+    unique_paths = list(dict.fromkeys(path for path in depot_paths if path))
+    persisted = _persisted_integration_sources()
+    pending = [
+        path for path in unique_paths
+        if path not in _INTEGRATION_SRC_CACHE and path not in persisted
+    ]
+
+    records_by_path = {}
+    if len(pending) > 1:
+        try:
+            records = get_default_p4_client().filelog_records_many(
+                [f"{path}#1" for path in pending]
+            )
+        except Exception:
+            records = []
+        for record in records:
+            if record.get("code") == "stat":
+                records_by_path.setdefault(record.get("depotFile"), record)
+
+    sources = {}
+    for path in unique_paths:
+        record = records_by_path.get(path)
+        if record is not None:
+            sources[path] = _store_integration_source(path, record, log_callback)
+        else:
+            sources[path] = get_integration_source_depot_path(path, log_callback)
+    return sources
+
+
+def _resolve_cascade(seed_depot: str, steps, log_callback=None):
+    """
+    Walk the integration chain starting at `seed_depot`
+    Yields (step_name, source_depot_path) for each name in `steps`, e.g.
+    ("FLUMEN", "BENI") from a REL path; stops at the first step without history.
+    Lookups go through the integration source cache, so both auto-resolve
+    entry points share results for the same chain
+    """
+    current = seed_depot
+    for step_name in steps:
+        current = get_integration_source_depot_path(current, log_callback)
+        if not current:
+            return
+        yield step_name, current
+
 
 def auto_resolve_vendor_branches(
     vince_input, beni_input, flumen_input, rel_input, log_callback
@@ -407,28 +765,25 @@ def auto_resolve_vendor_branches(
     """
 
     # Normalize inputs
-    vince_input = vince_input.strip() if vince_input else ""
-    beni_input = beni_input.strip() if beni_input else ""
-    flumen_input = flumen_input.strip() if flumen_input else ""
-    rel_input = rel_input.strip() if rel_input else ""
-
-    # Initialize resolved values with original inputs
-    resolved_vince = vince_input
-    resolved_beni = beni_input
-    resolved_flumen = flumen_input
-    resolved_rel = rel_input
+    branches = Branches.from_inputs(vince_input, beni_input, flumen_input, rel_input)
 
     # VINCE is always mandatory - validate it exists
-    if not vince_input:
+    if not branches.vince:
         raise RuntimeError("VINCE is mandatory and cannot be empty")
 
     log_callback(
         "[VENDOR AUTO-RESOLVE] Analyzing input combination for auto-resolve..."
     )
-    log_callback(f"[INPUT] VINCE: {vince_input}")
-    log_callback(f"[INPUT] BENI: {beni_input if beni_input else '(empty)'}")
-    log_callback(f"[INPUT] FLUMEN: {flumen_input if flumen_input else '(empty)'}")
-    log_callback(f"[INPUT] REL: {rel_input if rel_input else '(empty)'}")
+    _log_branches(log_callback, "INPUT", branches, "(empty)")
+
+    # BENI is the end of the chain; once it is given there is nothing to resolve
+    if branches.beni:
+        log_callback(
+            "[AUTO-RESOLVE] No auto-resolve needed - processing with provided inputs"
+        )
+        log_callback("[AUTO-RESOLVE] Final resolved values:")
+        _log_branches(log_callback, "RESOLVED", branches, "(not provided)")
+        return branches.beni, branches.vince, branches.flumen, branches.rel
 
     def resolve_vendor_input_to_depot_path_local(user_input, log_callback=None):
         """Local helper function to resolve vendor input"""
@@ -469,171 +824,139 @@ def auto_resolve_vendor_branches(
                 f"Input must be either depot path (//depot/...) or workspace (TEMPLATE_*): {user_input}"
             )
 
-    try:
-        # Case 1: REL + VINCE provided, but FLUMEN + BENI empty
-        # Auto-resolve: REL → FLUMEN → BENI (cascading)
-        if rel_input and vince_input and not flumen_input and not beni_input:
+    def adopt_beni(branches, flumen_depot_path, beni_source):
+        """Accept BENI only when it exists; otherwise keep going without it"""
+        if not beni_source:
             log_callback(
-                "[AUTO-RESOLVE] Case detected: REL + VINCE → Auto-resolve FLUMEN and BENI"
+                f"[WARNING] No integration history found for FLUMEN: {flumen_depot_path}"
             )
-
-            # Step 1: Resolve REL to depot path and sync
-            rel_depot_path, _ = find_device_common_mk_path(
-                rel_input, log_callback
+            return branches
+        # Validate BENI source exists
+        if not validate_depot_path(beni_source):
+            log_callback(
+                f"[WARNING] BENI integration source does not exist: {beni_source}"
             )
-            if not validate_depot_path(rel_depot_path):
-                raise RuntimeError(f"REL path does not existt: {rel_depot_path}")
+            return branches
+        log_callback(f"[AUTO] Successfully resolved BENI from FLUMEN: {beni_source}")
+        return replace(branches, beni=beni_source)
 
-            # Map and sync REL to get latest
-            map_single_depot(rel_depot_path)
-            sync_file_silent(rel_depot_path)
+    def resolve_from_rel(branches):
+        # Auto-resolve: REL → FLUMEN → BENI (cascading)
+        log_callback(
+            "[AUTO-RESOLVE] Case detected: REL + VINCE → Auto-resolve FLUMEN and BENI"
+        )
 
-            # Step 2: Get integration source for FLUMEN from REL
-            flumen_source = get_integration_source_depot_path(
-                rel_depot_path, log_callback
-            )
-            if flumen_source:
-                # Validate FLUMEN source exists
-                if validate_depot_path(flumen_source):
-                    resolved_flumen = flumen_source
-                    log_callback(
-                        f"[AUTO] Successfully resolved FLUMEN from REL: {flumen_source}"
-                    )
+        # Step 1: Resolve REL to depot path and sync
+        rel_depot_path, _ = find_device_common_mk_path(branches.rel, log_callback)
+        if not validate_depot_path(rel_depot_path):
+            raise RuntimeError(f"REL path does not existt: {rel_depot_path}")
 
-                    # Step 3: Get integration source for BENI from FLUMEN
-                    # Map and sync FLUMEN first
-                    map_single_depot(flumen_source)
-                    sync_file_silent(flumen_source)
+        # Map/sync and validation do not depend on the integration history
+        # lookups, so they run on worker threads while the chain is walked
+        with ThreadPoolExecutor(
+            max_workers=_AUTO_RESOLVE_WORKERS, thread_name_prefix="auto-resolve"
+        ) as executor:
+            # Map and sync REL to get latest
+            pending = [executor.submit(map_and_sync, rel_depot_path)]
 
-                    beni_source = get_integration_source_depot_path(
-                        flumen_source, log_callback
-                    )
-                    if beni_source:
-                        # Validate BENI source exists
-                        if validate_depot_path(beni_source):
-                            resolved_beni = beni_source
-                            log_callback(
-                                f"[AUTO] Successfully resolved BENI from FLUMEN: {beni_source}"
-                            )
-                        else:
-                            log_callback(
-                                f"[WARNING] BENI integration source does not exist: {beni_source}"
-                            )
-                    else:
-                        log_callback(
-                            f"[WARNING] No integration history found for FLUMEN: {flumen_source}"
-                        )
-                else:
-                    log_callback(
-                        f"[WARNING] FLUMEN integration source does not exist: {flumen_source}"
-                    )
-            else:
+            # Step 2: Get integration source for FLUMEN from REL
+            chain = _resolve_cascade(rel_depot_path, ("FLUMEN", "BENI"), log_callback)
+            _, flumen_source = next(chain, (None, None))
+            if not flumen_source:
                 log_callback(
                     f"[WARNING] No integration history found for REL: {rel_depot_path}"
                 )
-
-        # Case 2: FLUMEN + VINCE provided, but BENI empty (REL may or may not be provided)
-        # Auto-resolve: FLUMEN → BENI
-        elif flumen_input and vince_input and not beni_input:
-            log_callback(
-                "[AUTO-RESOLVE] Case detected: FLUMEN + VINCE → Auto-resolve BENI"
-            )
-
-            # Step 1: Resolve FLUMEN to depot path and sync
-            flumen_depot_path = resolve_vendor_input_to_depot_path_local(
-                flumen_input, log_callback
-            )
-            if not validate_depot_path(flumen_depot_path):
-                raise RuntimeError(f"FLUMEN path does not exist: {flumen_depot_path}")
-
-            # Map and sync FLUMEN to get latest
-            map_single_depot(flumen_depot_path)
-            sync_file_silent(flumen_depot_path)
-
-            # Step 2: Get integration source for BENI from FLUMEN
-            beni_source = get_integration_source_depot_path(
-                flumen_depot_path, log_callback
-            )
-            if beni_source:
-                # Validate BENI source exists
-                if validate_depot_path(beni_source):
-                    resolved_beni = beni_source
+            else:
+                flumen_exists = executor.submit(validate_depot_path, flumen_source)
+                beni_lookup = executor.submit(next, chain, (None, None))
+                # Validate FLUMEN source exists
+                if not flumen_exists.result():
                     log_callback(
-                        f"[AUTO] Successfully resolved BENI from FLUMEN: {beni_source}"
+                        f"[WARNING] FLUMEN integration source does not exist: {flumen_source}"
                     )
                 else:
+                    branches = replace(branches, flumen=flumen_source)
                     log_callback(
-                        f"[WARNING] BENI integration source does not exist: {beni_source}"
+                        f"[AUTO] Successfully resolved FLUMEN from REL: {flumen_source}"
                     )
-            else:
-                log_callback(
-                    f"[WARNING] No integration history found for FLUMEN: {flumen_depot_path}"
-                )
 
-        # Case 3: Both FLUMEN and REL provided + VINCE, but BENI empty
-        # Auto-resolve: FLUMEN → BENI (prefer FLUMEN over REL for BENI resolution)
-        elif flumen_input and rel_input and vince_input and not beni_input:
-            log_callback(
-                "[AUTO-RESOLVE] Case detected: FLUMEN + REL + VINCE → Auto-resolve BENI from FLUMEN"
-            )
+                    # Step 3: Get integration source for BENI from FLUMEN
+                    # Map and sync FLUMEN alongside the lookup
+                    pending.append(executor.submit(map_and_sync, flumen_source))
+                    _, beni_source = beni_lookup.result()
+                    branches = adopt_beni(branches, flumen_source, beni_source)
+
+            # Surface map/sync failures exactly as the sequential flow did
+            for future in pending:
+                future.result()
+        return branches
+
+    def resolve_from_flumen(branches):
+        # Auto-resolve: FLUMEN → BENI (FLUMEN is preferred over REL for BENI resolution)
+        log_callback(
+            "[AUTO-RESOLVE] Case detected: FLUMEN + VINCE → Auto-resolve BENI"
+        )
 
-            # Step 1: Resolve FLUMEN to depot path and sync
-            flumen_depot_path = resolve_vendor_input_to_depot_path_local(
-                flumen_input, log_callback
-            )
-            if not validate_depot_path(flumen_depot_path):
-                raise RuntimeError(f"FLUMEN path does not exist: {flumen_depot_path}")
+        # Step 1: Resolve FLUMEN to depot path and sync
+        flumen_depot_path = resolve_vendor_input_to_depot_path_local(
+            branches.flumen, log_callback
+        )
+        if not validate_depot_path(flumen_depot_path):
+            raise RuntimeError(f"FLUMEN path does not exist: {flumen_depot_path}")
 
-            # Map and sync FLUMEN to get latest
-            map_single_depot(flumen_depot_path)
-            sync_file_silent(flumen_depot_path)
+        # Map and sync FLUMEN to get latest
+        map_and_sync(flumen_depot_path)
 
-            # Step 2: Get integration source for BENI from FLUMEN
-            beni_source = get_integration_source_depot_path(
-                flumen_depot_path, log_callback
-            )
-            if beni_source:
-                # Validate BENI source exists
-                if validate_depot_path(beni_source):
-                    resolved_beni = beni_source
-                    log_callback(
-                        f"[AUTO] Successfully resolved BENI from FLUMEN: {beni_source}"
-                    )
-                else:
-                    log_callback(
-                        f"[WARNING] BENI integration source does not exist: {beni_source}"
-                    )
-            else:
-                log_callback(
-                    f"[WARNING] No integration history found for FLUMEN: {flumen_depot_path}"
-                )
+        # Step 2: Get integration source for BENI from FLUMEN
+        beni_source = dict(
+            _resolve_cascade(flumen_depot_path, ("BENI",), log_callback)
+        ).get("BENI")
+        return adopt_beni(branches, flumen_depot_path, beni_source)
 
-        # Case 4: All fields provided or only BENI + VINCE
-        else:
+    handlers = {"rel": resolve_from_rel, "flumen": resolve_from_flumen}
+
+    try:
+        # FLUMEN and REL workspaces resolve independently; fetch both client
+        # specs at once (each p4 call still takes a process slot) before the
+        # cascade needs them
+        workspaces = [
+            value for value in (branches.flumen, branches.rel)
+            if classify_input(value) is InputKind.WORKSPACE
+        ]
+        if len(workspaces) == 2:
+            with ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="auto-resolve"
+            ) as executor:
+                for future in [executor.submit(find_device_common_mk_path, name) for name in workspaces]:
+                    try:
+                        future.result()
+                    except Exception:
+                        # Failures are not cached; the handler that needs it reports them
+                        pass
+
+        seed = _cascade_seed(branches)
+        if seed is None:
             log_callback(
                 "[AUTO-RESOLVE] No auto-resolve needed - processing with provided inputs"
             )
+            resolved = branches
+        else:
+            resolved = handlers[seed](branches)
 
         # Log final resolved values
         log_callback("[AUTO-RESOLVE] Final resolved values:")
-        log_callback(f"[RESOLVED] VINCE: {resolved_vince}")
-        log_callback(
-            f"[RESOLVED] BENI: {resolved_beni if resolved_beni else '(not provided)'}"
-        )
-        log_callback(
-            f"[RESOLVED] FLUMEN: {resolved_flumen if resolved_flumen else '(not provided)'}"
-        )
-        log_callback(
-            f"[RESOLVED] REL: {resolved_rel if resolved_rel else '(not provided)'}"
-        )
+        _log_branches(log_callback, "RESOLVED", resolved, "(not provided)")
 
-        return resolved_beni, resolved_vince, resolved_flumen, resolved_rel
+        return resolved.beni, resolved.vince, resolved.flumen, resolved.rel
 
     except Exception as e:
         log_callback(f"[AUTO-RESOLVE ERROR] {str(e)}")
         # Continue with original inputs instead of failing completely
         log_callback("[AUTO-RESOLVE] Continuing with original inputs due to error")
-        return beni_input, vince_input, flumen_input, rel_input
+        return branches.beni, branches.vince, branches.flumen, branches.rel
+    finally:
+        # Persist what this run learned in one write
+        flush_integration_cache()
 
 
 # Update the __all__ export list to include the new function
@@ -650,114 +973,68 @@ def auto_resolve_missing_branches(
     """
 
     # Normalize inputs
-    vince_input = vince_input.strip() if vince_input else ""
-    flumen_input = flumen_input.strip() if flumen_input else ""
-    beni_input = beni_input.strip() if beni_input else ""
-    rel_input = rel_input.strip() if rel_input else ""
-
-    # Initialize resolved values with original inputs
-    resolved_vince = vince_input
-    resolved_flumen = flumen_input
-    resolved_beni = beni_input
-    resolved_rel = rel_input
+    branches = Branches.from_inputs(vince_input, beni_input, flumen_input, rel_input)
 
     # VINCE is always mandatory - validate it exists
-    if not vince_input:
+    if not branches.vince:
         raise RuntimeError("VINCE is mandatory and cannot be empty")
 
-    try:
-        # Case 1: VINCE + REL provided, but FLUMEN + BENI empty
-        # Auto-resolve: REL → FLUMEN → BENI (cascading)
-        if vince_input and rel_input and not flumen_input and not beni_input:
-            log_callback(
-                "[AUTO-RESOLVE] Case detected: VINCE + REL → Auto-resolve FLUMEN and BENI"
-            )
-
-            # Step 1: Resolve REL to depot path and sync
-            rel_depot_path, _ = find_device_common_mk_path(rel_input)
-            if not validate_depot_path(rel_depot_path):
-                raise RuntimeError(f"REL path does not existtt: {rel_depot_path}")
-
-            # Map and sync REL to get latest
-            map_single_depot(rel_depot_path)
-            sync_file_silent(rel_depot_path)
-
-            # Step 2: Get integration source for FLUMEN from REL
-            flumen_source = get_integration_source_depot_path(
-                rel_depot_path, log_callback
-            )
-            if not flumen_source:
-                raise RuntimeError(
-                    f"No integration history found for REL: {rel_depot_path}"
-                )
-
-            # Validate FLUMEN source exists
-            if not validate_depot_path(flumen_source):
-                raise RuntimeError(
-                    f"Integration source does not exist: {flumen_source}"
-                )
-
-            resolved_flumen = flumen_source
-            log_callback(f"[AUTO] Detected FLUMEN from REL: {flumen_source}")
-
-            # Step 3: Get integration source for BENI from FLUMEN
-            # Map and sync FLUMEN first
-            map_single_depot(flumen_source)
-            sync_file_silent(flumen_source)
-
-            beni_source = get_integration_source_depot_path(flumen_source, log_callback)
-            if not beni_source:
-                raise RuntimeError(
-                    f"No integration history found for FLUMEN: {flumen_source}"
-                )
-
-            # Validate BENI source exists
-            if not validate_depot_path(beni_source):
-                raise RuntimeError(f"Integration source does not exist: {beni_source}")
+    # Pick the cascade before any P4 work; BENI given (or nothing to start
+    # from) means there is nothing to resolve
+    seed = _cascade_seed(branches)
+    if seed is None:
+        log_callback(
+            "[AUTO-RESOLVE] No auto-resolve needed - processing with provided inputs"
+        )
+        return branches.beni, branches.flumen, branches.rel, branches.vince
 
-            resolved_beni = beni_source
-            log_callback(f"[AUTO] Detected BENI from FLUMEN: {beni_source}")
+    targets = BRANCH_CHAIN[BRANCH_CHAIN.index(seed) + 1:]
+    log_callback(
+        f"[AUTO-RESOLVE] Case detected: VINCE + {seed.upper()} → Auto-resolve "
+        + " and ".join(name.upper() for name in targets)
+    )
 
-        # Case 2: VINCE + FLUMEN provided, but BENI empty (REL may or may not be provided)
-        # Auto-resolve: FLUMEN → BENI
-        elif vince_input and flumen_input and not beni_input:
-            log_callback(
-                "[AUTO-RESOLVE] Case detected: VINCE + FLUMEN → Auto-resolve BENI"
+    try:
+        # Step 1: Resolve the seed branch to a depot path
+        seed_depot_path, _ = find_device_common_mk_path(getattr(branches, seed))
+
+        # Step 2: Walk the chain from the seed. Integration history lives on
+        # the server, so nothing has to be mapped first and every path can be
+        # validated together in one P4 call afterwards
+        chain = dict(
+            _resolve_cascade(
+                seed_depot_path, tuple(name.upper() for name in targets), log_callback
             )
+        )
+        existing = validate_depot_paths_bulk([seed_depot_path, *chain.values()])
 
-            # Step 1: Resolve FLUMEN to depot path and sync
-            flumen_depot_path, _ = find_device_common_mk_path(flumen_input)
-            if not validate_depot_path(flumen_depot_path):
-                raise RuntimeError(f"FLUMEN path does not exist: {flumen_depot_path}")
-
-            # Map and sync FLUMEN to get latest
-            map_single_depot(flumen_depot_path)
-            sync_file_silent(flumen_depot_path)
+        if not existing.get(seed_depot_path):
+            raise RuntimeError(f"{seed.upper()} path does not exist: {seed_depot_path}")
 
-            # Step 2: Get integration source for BENI from FLUMEN
-            beni_source = get_integration_source_depot_path(
-                flumen_depot_path, log_callback
-            )
-            if not beni_source:
+        sources = {}
+        previous_name, previous_path = seed.upper(), seed_depot_path
+        for name in targets:
+            source = chain.get(name.upper())
+            if not source:
                 raise RuntimeError(
-                    f"No integration history found for FLUMEN: {flumen_depot_path}"
+                    f"No integration history found for {previous_name}: {previous_path}"
                 )
-
-            # Validate BENI source exists
-            if not validate_depot_path(beni_source):
-                raise RuntimeError(f"Integration source does not exist: {beni_source}")
-
-            resolved_beni = beni_source
-            log_callback(f"[AUTO] Detected BENI from FLUMEN: {beni_source}")
-
-        # Case 3: All fields provided or no auto-resolve needed
-        else:
-            log_callback(
-                "[AUTO-RESOLVE] No auto-resolve needed - processing with provided inputs"
-            )
-
-        return resolved_beni, resolved_flumen, resolved_rel, resolved_vince
+            if not existing.get(source):
+                raise RuntimeError(f"Integration source does not exist: {source}")
+            log_callback(f"[AUTO] Detected {name.upper()} from {previous_name}: {source}")
+            sources[name] = source
+            previous_name, previous_path = name.upper(), source
+
+        # Step 3: Map and sync every resolved branch except BENI to get latest
+        _cascade_apply(
+            [seed_depot_path] + [sources[name] for name in targets[:-1]]
+        )
+        resolved = replace(branches, **sources)
+        return resolved.beni, resolved.flumen, resolved.rel, resolved.vince
 
     except Exception as e:
         log_callback(f"[AUTO-RESOLVE ERROR] {str(e)}")
         raise RuntimeError(f"Auto-resolve failed: {str(e)}")
+    finally:
+        # Persist what this run learned in one write
+        flush_integration_cache()
@@ -6,13 +6,63 @@ Updated to handle info messages for no differences scenario
 FIXED: Auto-resolve validation now works with resolved targets
 """
 
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+from concurrent.futures import Future
 from config.p4_config import get_client_name, get_workspace_root
-from core.p4_operations import auto_resolve_vendor_branches
+from core.p4_operations import (
+    InputKind,
+    auto_resolve_missing_branches,
+    auto_resolve_vendor_branches,
+    classify_input,
+    find_device_common_mk_path,
+    reset_p4_caches,
+    validate_depot_path,
+    validate_device_common_mk_path,
+)
 from services.bringup_service import BringupService
 
+# Branch input rows in display order, shared by the Vendor and System sections
+_BRANCH_FIELDS = ("BENI", "VINCE", "FLUMEN", "REL")
+
+# Shown for inputs that are neither a depot path nor a TEMPLATE_* workspace
+_VENDOR_FORMAT_ERROR = "{} must be either depot path (//depot/...) or workspace (TEMPLATE_*)"
+_SYSTEM_FORMAT_ERROR = "{} must be either device_common.mk depot path or workspace (TEMPLATE_*)"
+
+_VENDOR_VINCE_REQUIRED = (
+    "VINCE is mandatory and must be depot path (//depot/...) or workspace (TEMPLATE_*)"
+)
+
+# Marks the start of a new run in the log; the log widget itself caps its length
+_RUN_SEPARATOR = "=" * 60 + "\n[NEW RUN] %s"
+
+# Logged once per system run, as a single message
+_SYSTEM_BANNER = "\n".join([
+    "[SYSTEM] Using FIXED system process with:",
+    "[ENHANCEMENT] FIXED auto-resolve with correct p4 filelog -m 1 -i <path>#1 parsing",
+    "[ENHANCEMENT] FIXED target processing - ALL auto-resolved targets will be processed",
+    "[ENHANCEMENT] Enhanced Samsung vendor path filtering with priority logic",
+    "[ENHANCEMENT] Mixed input support (depot paths + workspaces)",
+    "[ENHANCEMENT] Improved workspace resolution using parse_process.py approach",
+])
+
+
+# Persistent workers that check inputs against P4 concurrently
+_VALIDATION_WORKERS = 4
+
+
+def _work_forever(jobs):
+    """Worker loop: run each callable taken from the jobs queue"""
+    while True:
+        job = jobs.get()
+        try:
+            job()
+        finally:
+            jobs.task_done()
+
 
 class BringupTab:
     """Bringup tab component with Vendor and System sections supporting mixed input and FIXED auto-resolve"""
@@ -24,10 +74,78 @@ class BringupTab:
         # Create the bringup frame
         self.frame = ttk.Frame(parent)
         self.bringup_service = BringupService()
+
+        # Long-lived daemon workers, so closing the window never waits on P4.
+        # Runs share one worker: vendor and system runs both rewrite the client
+        # spec and open files, so a second run queues behind the first
+        self._run_jobs = queue.Queue()
+        self._validation_jobs = queue.Queue()
+        self._closing = threading.Event()
+        self._start_workers()
         
         # Initialize components
         self.create_content()
 
+    def _start_workers(self):
+        """Start the run worker and the validation workers"""
+        threading.Thread(
+            target=_work_forever, args=(self._run_jobs,), name="bringup-run", daemon=True
+        ).start()
+        for index in range(_VALIDATION_WORKERS):
+            threading.Thread(
+                target=_work_forever,
+                args=(self._validation_jobs,),
+                name=f"bringup-validate-{index}",
+                daemon=True,
+            ).start()
+
+    def _submit_validation(self, fn, *args):
+        """Queue fn(*args) on a validation worker and return a Future for its result"""
+        future = Future()
+
+        def job():
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+        self._validation_jobs.put(job)
+        return future
+
+    def _create_branch_rows(self, parent):
+        """Create one labelled entry row per branch; returns {branch name: entry}"""
+        entries = {}
+        for row, name in enumerate(_BRANCH_FIELDS):
+            ttk.Label(parent, text=f"{name}:").grid(column=0, row=row, sticky="w", pady=2)
+            entry = ttk.Entry(parent, width=70)
+            entry.grid(column=1, row=row, padx=5, pady=2, sticky="ew")
+            entries[name] = entry
+        return entries
+
+    @staticmethod
+    def _check_formats(inputs, format_error):
+        """
+        Screen every given input before any P4 work; all inputs that are neither a
+        depot path nor a workspace are reported in one dialog. Returns True when all pass.
+        """
+        errors = [
+            format_error.format(name)
+            for name in _BRANCH_FIELDS
+            if inputs[name] and classify_input(inputs[name]) is InputKind.LITERAL
+        ]
+        if errors:
+            messagebox.showerror("Invalid Input", "\n".join(errors))
+            return False
+        return True
+
+    @staticmethod
+    def _read_entries(entries):
+        """Return the stripped text of each branch entry; empty entries are not stripped"""
+        return {
+            name: text.strip() if (text := entry.get()) else ""
+            for name, entry in entries.items()
+        }
+
     def create_content(self):
         """Create content for bringup mode with both Vendor and System sections"""
         # Create main container with scrollable frame
@@ -40,33 +158,8 @@ class BringupTab:
         vendor_frame = ttk.LabelFrame(main_container, text="Vendor", padding=10)
         vendor_frame.pack(fill="x", pady=(0, 10))
 
-        # BENI Path/Workspace
-        ttk.Label(vendor_frame, text="BENI:").grid(
-            column=0, row=0, sticky="w", pady=2
-        )
-        self.beni_entry = ttk.Entry(vendor_frame, width=70)
-        self.beni_entry.grid(column=1, row=0, padx=5, pady=2, sticky="ew")
-
-        # VINCE Path/Workspace
-        ttk.Label(vendor_frame, text="VINCE:").grid(
-            column=0, row=1, sticky="w", pady=2
-        )
-        self.vince_entry = ttk.Entry(vendor_frame, width=70)
-        self.vince_entry.grid(column=1, row=1, padx=5, pady=2, sticky="ew")
-
-        # FLUMEN Path/Workspace
-        ttk.Label(vendor_frame, text="FLUMEN:").grid(
-            column=0, row=2, sticky="w", pady=2
-        )
-        self.flumen_entry = ttk.Entry(vendor_frame, width=70)
-        self.flumen_entry.grid(column=1, row=2, padx=5, pady=2, sticky="ew")
-
-        # REL Path/Workspace
-        ttk.Label(vendor_frame, text="REL:").grid(
-            column=0, row=3, sticky="w", pady=2
-        )
-        self.rel_entry = ttk.Entry(vendor_frame, width=70)
-        self.rel_entry.grid(column=1, row=3, padx=5, pady=2, sticky="ew")
+        # BENI / VINCE / FLUMEN / REL Path/Workspace
+        self.vendor_entries = self._create_branch_rows(vendor_frame)
 
         # Configure grid weights for vendor frame
         vendor_frame.columnconfigure(1, weight=1)
@@ -93,33 +186,8 @@ class BringupTab:
         system_frame = ttk.LabelFrame(main_container, text="System", padding=10)
         system_frame.pack(fill="x", pady=(0, 10))
 
-        # BENI Workspace/Path
-        ttk.Label(system_frame, text="BENI:").grid(
-            column=0, row=0, sticky="w", pady=2
-        )
-        self.beni_workspace_entry = ttk.Entry(system_frame, width=70)
-        self.beni_workspace_entry.grid(column=1, row=0, padx=5, pady=2, sticky="ew")
-
-        # VINCE Workspace/Path
-        ttk.Label(system_frame, text="VINCE:").grid(
-            column=0, row=1, sticky="w", pady=2
-        )
-        self.vince_workspace_entry = ttk.Entry(system_frame, width=70)
-        self.vince_workspace_entry.grid(column=1, row=1, padx=5, pady=2, sticky="ew")
-
-        # FLUMEN Workspace/Path
-        ttk.Label(system_frame, text="FLUMEN:").grid(
-            column=0, row=2, sticky="w", pady=2
-        )
-        self.flumen_workspace_entry = ttk.Entry(system_frame, width=70)
-        self.flumen_workspace_entry.grid(column=1, row=2, padx=5, pady=2, sticky="ew")
-
-        # REL Workspace/Path
-        ttk.Label(system_frame, text="REL:").grid(
-            column=0, row=3, sticky="w", pady=2
-        )
-        self.rel_workspace_entry = ttk.Entry(system_frame, width=70)
-        self.rel_workspace_entry.grid(column=1, row=3, padx=5, pady=2, sticky="ew")
+        # BENI / VINCE / FLUMEN / REL Workspace/Path
+        self.system_entries = self._create_branch_rows(system_frame)
 
         # Configure grid weights for system frame
         system_frame.columnconfigure(1, weight=1)
@@ -154,6 +222,10 @@ class BringupTab:
         self.vendor_progress_callback = self.gui_utils.create_progress_callback(self.vendor_progress)
         self.system_progress_callback = self.gui_utils.create_progress_callback(self.system_progress)
 
+        # Widgets reset by clear_all, collected once
+        self._all_entries = (*self.vendor_entries.values(), *self.system_entries.values())
+        self._progress_bars = (self.vendor_progress, self.system_progress)
+
     def show(self):
         """Show the bringup tab"""
         self.frame.pack(fill="both", expand=True)
@@ -162,26 +234,29 @@ class BringupTab:
         """Hide the bringup tab"""
         self.frame.pack_forget()
 
+    def shutdown(self):
+        """Stop the workers from touching the UI when the application closes
+
+        Must be called before the root window is destroyed: waiting runs are
+        dropped and running ones stop posting to the UI.
+        """
+        self._closing.set()
+
     def clear_all(self):
         """Clear all input fields and logs"""
-        # Clear vendor input fields
-        self.beni_entry.delete(0, tk.END)
-        self.vince_entry.delete(0, tk.END)
-        self.flumen_entry.delete(0, tk.END)
-        self.rel_entry.delete(0, tk.END)
-
-        # Clear system input fields
-        self.beni_workspace_entry.delete(0, tk.END)
-        self.vince_workspace_entry.delete(0, tk.END)
-        self.flumen_workspace_entry.delete(0, tk.END)
-        self.rel_workspace_entry.delete(0, tk.END)
+        # Clear vendor and system input fields
+        for entry in self._all_entries:
+            entry.delete(0, tk.END)
 
         # Clear log output
         self.gui_utils.clear_text_widget(self.log_text)
 
         # Reset progress bars
-        self.gui_utils.reset_progress(self.vendor_progress)
-        self.gui_utils.reset_progress(self.system_progress)
+        for progress_bar in self._progress_bars:
+            self.gui_utils.reset_progress(progress_bar)
+
+        # Forget P4 lookups made for the previous inputs
+        reset_p4_caches()
 
         self.log_callback("[INFO] All fields and logs cleared.")
         self.gui_utils.update_status(
@@ -191,46 +266,45 @@ class BringupTab:
     def _validate_vendor_input(self, user_input, field_name):
         """
         Validate vendor input (can be depot path or workspace)
+        user_input is expected to be stripped already (see _read_entries)
         Returns (is_valid, resolved_depot_path, error_message)
         """
         if not user_input:
             return True, "", None  # Empty is OK for optional fields
         
-        user_input = user_input.strip()
+        kind = classify_input(user_input)
         
         # Check if it's a depot path
-        if user_input.startswith("//"):
-            from core.p4_operations import validate_depot_path
+        if kind is InputKind.DEPOT:
             if validate_depot_path(user_input):
                 return True, user_input, None
             else:
                 return False, "", f"{field_name} depot path does not exist: {user_input}"
         
         # Check if it's a workspace
-        elif user_input.upper().startswith("TEMPLATE"):
+        elif kind is InputKind.WORKSPACE:
             try:
-                from core.p4_operations import find_device_common_mk_path
                 resolved_path, _= find_device_common_mk_path(user_input)
                 return True, resolved_path, None
             except Exception as e:
                 return False, "", f"{field_name} workspace resolution failed: {str(e)}"
         
         else:
-            return False, "", f"{field_name} must be either depot path (//depot/...) or workspace (TEMPLATE_*)"
+            return False, "", _VENDOR_FORMAT_ERROR.format(field_name)
 
     def _validate_system_input(self, user_input, field_name):
         """
         Validate system input (can be workspace or depot path to device_common.mk)
+        user_input is expected to be stripped already (see _read_entries)
         Returns (is_valid, resolved_input, error_message)
         """
         if not user_input:
             return True, "", None  # Empty is OK for optional fields
         
-        user_input = user_input.strip()
+        kind = classify_input(user_input)
         
         # Check if it's a depot path
-        if user_input.startswith("//"):
-            from core.p4_operations import validate_device_common_mk_path
+        if kind is InputKind.DEPOT:
             exists, is_device_common = validate_device_common_mk_path(user_input)
             
             if not exists:
@@ -240,53 +314,84 @@ class BringupTab:
             else:
                 return True, user_input, None
         
-        # Check if it's a workspace
-        elif user_input.upper().startswith("TEMPLATE"):
+        # Check if it's a workspace; the lookup is cached, so checking it here
+        # catches a mistyped name before auto-resolve edits the client spec
+        elif kind is InputKind.WORKSPACE:
             try:
-                from core.p4_operations import find_device_common_mk_path
-                resolved_path, _ = find_device_common_mk_path(user_input)
+                find_device_common_mk_path(user_input)
                 return True, user_input, None  # Keep original workspace for system processing
             except Exception as e:
                 return False, "", f"{field_name} workspace resolution failed: {str(e)}"
         
         else:
-            return False, "", f"{field_name} must be either device_common.mk depot path or workspace (TEMPLATE_*)"
-
-    def _create_enhanced_error_callback(self):
-        """Create enhanced error callback that can handle both error and info messages"""
-        def error_callback(title, message, is_info=False):
-            def show_dialog():
-                if is_info:
-                    messagebox.showinfo(title, message)
-                else:
-                    messagebox.showerror(title, message)
-            
-            # Schedule dialog to show in main thread
-            self.gui_utils.root.after(0, show_dialog)
-        
-        return error_callback
+            return False, "", _SYSTEM_FORMAT_ERROR.format(field_name)
+
+    def _enhanced_error_callback(self, title, message, is_info=False):
+        """Error callback that can show both error and info messages from a worker thread"""
+        show_dialog = messagebox.showinfo if is_info else messagebox.showerror
+        # Schedule dialog to show in main thread
+        self.gui_utils.root.after(0, show_dialog, title, message)
+
+    def _require(self, field_name, value, empty_message, check=None):
+        """
+        Check a mandatory input, showing an error dialog when it is missing or invalid.
+        `check` returns (is_valid, resolved, error_message); without it only presence
+        is checked. Returns the resolved value, or None on failure.
+        """
+        if not value:
+            messagebox.showerror("Invalid Input", empty_message)
+            return None
+        if check is None:
+            return value
+        is_valid, resolved, error_msg = check()
+        if not is_valid or not resolved:
+            messagebox.showerror("Invalid Input", error_msg or f"{field_name} validation failed")
+            return None
+        return resolved
+
+    def _guarded_start(self, start_button, start):
+        """
+        Run a start handler with its button disabled so repeated clicks are ignored.
+        The button stays disabled when the handler launched a run (returned True);
+        the run's done-callback re-enables it.
+        """
+        if start_button.instate(["disabled"]):
+            return
+        start_button.configure(state="disabled")
+        self.log_callback(_RUN_SEPARATOR % time.strftime("%H:%M:%S"))
+        launched = False
+        try:
+            launched = start()
+        finally:
+            if not launched:
+                start_button.configure(state="normal")
 
     def on_vendor_start(self):
-        """Handle vendor bringup start button click with auto-resolve functionality"""
-        beni_input = self.beni_entry.get().strip()
-        vince_input = self.vince_entry.get().strip()
-        flumen_input = self.flumen_entry.get().strip()
-        rel_input = self.rel_entry.get().strip()
-
-        # Validate VINCE (mandatory)
-        if not vince_input:
-            messagebox.showerror(
-                "Invalid Input",
-                "VINCE is mandatory and must be depot path (//depot/...) or workspace (TEMPLATE_*)",
-            )
+        """Handle vendor bringup start button click"""
+        self._guarded_start(self.vendor_start_btn, self._start_vendor)
+
+    def on_system_start(self):
+        """Handle system bringup start button click"""
+        self._guarded_start(self.system_start_btn, self._start_system)
+
+    def _start_vendor(self):
+        """Validate and auto-resolve vendor inputs, then launch the run; returns True when launched"""
+        inputs = self._read_entries(self.vendor_entries)
+        beni_input, vince_input, flumen_input, rel_input = (inputs[name] for name in _BRANCH_FIELDS)
+
+        # Server state may have changed since the last run
+        reset_p4_caches()
+
+        # Validate VINCE (mandatory); its P4 check runs after auto-resolve
+        if self._require("VINCE", vince_input, _VENDOR_VINCE_REQUIRED) is None:
+            return
+        if not self._check_formats(inputs, _VENDOR_FORMAT_ERROR):
             return
 
         # ============================================================================
         # VENDOR AUTO-RESOLVE FUNCTIONALITY
         # ============================================================================
         try:
-            from core.p4_operations import auto_resolve_vendor_branches
-            
             # Check if auto-resolve is needed (not all fields are provided)
             all_fields_provided = beni_input and vince_input and flumen_input and rel_input
             auto_resolve_needed = not all_fields_provided
@@ -330,50 +435,42 @@ class BringupTab:
         # ============================================================================
         # VALIDATE FINAL RESOLVED INPUTS
         # ============================================================================
+        # Each input is checked against P4 independently; run the checks together
+        given_targets = {"BENI": beni_input, "FLUMEN": flumen_input, "REL": rel_input}
+        final_targets = {"BENI": final_beni_input, "FLUMEN": final_flumen_input, "REL": final_rel_input}
+        validations = {
+            field_name: self._submit_validation(self._validate_vendor_input, value, field_name)
+            for field_name, value in final_targets.items()
+            if value
+        }
+        validations["VINCE"] = self._submit_validation(
+            self._validate_vendor_input, final_vince_input, "VINCE"
+        )
+
         # Validate VINCE with resolved input
-        is_valid, vince_path, error_msg = self._validate_vendor_input(final_vince_input, "VINCE")
-        if not is_valid or not vince_path:
-            messagebox.showerror(
-                "Invalid Input",
-                error_msg or "VINCE validation failed after auto-resolve",
-            )
+        vince_path = self._require(
+            "VINCE", final_vince_input, _VENDOR_VINCE_REQUIRED, validations["VINCE"].result
+        )
+        if vince_path is None:
             return
 
         # Validate resolved targets
         valid_targets = []
-        final_beni_path = final_flumen_path = final_rel_path = ""
-        
-        if final_beni_input:
-            is_valid, final_beni_path, error_msg = self._validate_vendor_input(final_beni_input, "BENI")
-            if not is_valid:
-                # Log warning but don't stop process if auto-resolved BENI fails validation
-                if beni_input != final_beni_input:  # This was auto-resolved
-                    self.log_callback(f"[WARNING] Auto-resolved BENI validation failed: {error_msg}")
-                else:
-                    messagebox.showerror("Invalid Input", error_msg)
-                    return
-            elif final_beni_path:
-                valid_targets.append("BENI")
-
-        if final_flumen_input:
-            is_valid, final_flumen_path, error_msg = self._validate_vendor_input(final_flumen_input, "FLUMEN")
-            if not is_valid:
-                # Log warning but don't stop process if auto-resolved FLUMEN fails validation
-                if flumen_input != final_flumen_input:  # This was auto-resolved
-                    self.log_callback(f"[WARNING] Auto-resolved FLUMEN validation failed: {error_msg}")
-                else:
-                    messagebox.showerror("Invalid Input", error_msg)
-                    return
-            elif final_flumen_path:
-                valid_targets.append("FLUMEN")
-
-        if final_rel_input:
-            is_valid, final_rel_path, error_msg = self._validate_vendor_input(final_rel_input, "REL")
+        target_paths = dict.fromkeys(final_targets, "")
+        for field_name, final_input in final_targets.items():
+            if not final_input:
+                continue
+            is_valid, target_path, error_msg = validations[field_name].result()
             if not is_valid:
+                # Log warning but don't stop process if an auto-resolved target fails validation
+                if given_targets[field_name] != final_input:
+                    self.log_callback(f"[WARNING] Auto-resolved {field_name} validation failed: {error_msg}")
+                    continue
                 messagebox.showerror("Invalid Input", error_msg)
                 return
-            elif final_rel_path:
-                valid_targets.append("REL")
+            if target_path:
+                target_paths[field_name] = target_path
+                valid_targets.append(field_name)
 
         if not valid_targets:
             messagebox.showerror(
@@ -386,34 +483,38 @@ class BringupTab:
         self.log_callback(f"[VENDOR] Will process {len(valid_targets)} targets: {', '.join(valid_targets)}")
 
         # Run vendor process with resolved paths
-        self._run_vendor_process(final_beni_path, vince_path, final_flumen_path, final_rel_path)
+        self._run_vendor_process(
+            target_paths["BENI"], vince_path, target_paths["FLUMEN"], target_paths["REL"]
+        )
+        return True
 
-    def on_system_start(self):
-        """FIXED: Handle system bringup with proper auto-resolve validation"""
-        beni_input = self.beni_workspace_entry.get().strip()
-        vince_input = self.vince_workspace_entry.get().strip()
-        flumen_input = self.flumen_workspace_entry.get().strip()
-        rel_input = self.rel_workspace_entry.get().strip()
-
-        # Validate VINCE (mandatory)
-        if not vince_input:
-            messagebox.showerror("Invalid Input", "VINCE is mandatory for system bringup")
-            return
+    def _start_system(self):
+        """FIXED: system bringup with proper auto-resolve validation; returns True when launched"""
+        inputs = self._read_entries(self.system_entries)
+        beni_input, vince_input, flumen_input, rel_input = (inputs[name] for name in _BRANCH_FIELDS)
+
+        # Server state may have changed since the last run
+        reset_p4_caches()
 
-        # Basic validation of VINCE input format
-        is_valid, vince_resolved, error_msg = self._validate_system_input(vince_input, "VINCE")
-        if not is_valid:
-            messagebox.showerror("Invalid Input", error_msg)
+        # Validate input formats, then VINCE (mandatory)
+        if not self._check_formats(inputs, _SYSTEM_FORMAT_ERROR):
+            return
+        if self._require(
+            "VINCE",
+            vince_input,
+            "VINCE is mandatory for system bringup",
+            lambda: self._validate_system_input(vince_input, "VINCE"),
+        ) is None:
             return
 
         # ============================================================================
         # AUTO-RESOLVE MISSING BRANCHES - FIXED TO WORK WITH system_process.py
         # ============================================================================
         try:
-            from core.p4_operations import auto_resolve_missing_branches
-            
-            self.log_callback("[SYSTEM] Starting FIXED auto-resolve for missing branches...")
-            self.log_callback("[AUTO-RESOLVE] Using FIXED integration history parsing with p4 filelog -i <path>#1")
+            self.log_callback(
+                "[SYSTEM] Starting FIXED auto-resolve for missing branches...\n"
+                "[AUTO-RESOLVE] Using FIXED integration history parsing with p4 filelog -m 1 -i <path>#1"
+            )
             
             # Call auto-resolve function
             resolved_beni, resolved_flumen, resolved_rel, resolved_vince = auto_resolve_missing_branches(
@@ -443,12 +544,14 @@ class BringupTab:
                 return
             
             # Log final resolved inputs
-            self.log_callback("[AUTO-RESOLVE] Using final resolved inputs for system processing:")
-            self.log_callback(f"[FINAL] VINCE: {final_vince_input}")
-            self.log_callback(f"[FINAL] BENI: {final_beni_input if final_beni_input else '(not available)'}")
-            self.log_callback(f"[FINAL] FLUMEN: {final_flumen_input if final_flumen_input else '(not available)'}")
-            self.log_callback(f"[FINAL] REL: {final_rel_input if final_rel_input else '(not available)'}")
-            self.log_callback(f"[TARGETS] Will process {len(targets_available)} targets: {', '.join(targets_available)}")
+            self.log_callback("\n".join([
+                "[AUTO-RESOLVE] Using final resolved inputs for system processing:",
+                f"[FINAL] VINCE: {final_vince_input}",
+                f"[FINAL] BENI: {final_beni_input or '(not available)'}",
+                f"[FINAL] FLUMEN: {final_flumen_input or '(not available)'}",
+                f"[FINAL] REL: {final_rel_input or '(not available)'}",
+                f"[TARGETS] Will process {len(targets_available)} targets: {', '.join(targets_available)}",
+            ]))
             
         except Exception as e:
             error_msg = f"FIXED Auto-resolve failed: {str(e)}"
@@ -458,106 +561,91 @@ class BringupTab:
 
         # Run FIXED system process with ALL resolved inputs
         self._run_system_process(final_beni_input, final_vince_input, final_flumen_input, final_rel_input)
+        return True
 
-    def _run_vendor_process(self, beni_path, vince_path, flumen_path, rel_path):
-        """Run vendor bringup process in separate thread (enhanced functionality)"""
-        # Clear log and reset progress
-        self.gui_utils.clear_text_widget(self.log_text)
-        self.gui_utils.reset_progress(self.vendor_progress)
-
-        # Log P4 configuration info
+    def _log_p4_config(self):
+        """Log the client and workspace resolved once at startup"""
         client_name = get_client_name()
         workspace_root = get_workspace_root()
         if client_name and workspace_root:
             self.log_callback(f"[CONFIG] Using P4 Client: {client_name}")
             self.log_callback(f"[CONFIG] Using Workspace: {workspace_root}")
 
-        # Disable start button during processing
-        self.vendor_start_btn.configure(state="disabled")
-
-        # Create enhanced error callback
-        enhanced_error_callback = self._create_enhanced_error_callback()
-
-        def run_process_thread():
-            try:
-                self.gui_utils.update_status("Processing: Running vendor bring up operation...")
-                result = self.bringup_service.run_vendor(
-                    beni_path,
-                    vince_path,
-                    flumen_path,
-                    rel_path,
-                    log_callback=self.log_callback,
-                    progress_callback=self.vendor_progress_callback,
-                    error_callback=enhanced_error_callback,
-                )
-                if not result.success:
-                    self.gui_utils.error_callback("Vendor Bringup Error", result.message)
-            finally:
-                # Re-enable button when done
-                self.gui_utils.root.after(
-                    0, lambda: self.vendor_start_btn.configure(state="normal")
-                )
-                self.gui_utils.root.after(
-                    0,
-                    lambda: self.gui_utils.update_status("Mode: Bring up - Vendor operation completed"),
-                )
-
-        # Start the process in a separate thread
-        thread = threading.Thread(target=run_process_thread, daemon=True)
-        thread.start()
+    def _run_vendor_process(self, beni_path, vince_path, flumen_path, rel_path):
+        """Run vendor bringup process in separate thread (enhanced functionality)"""
+        self._run_job(
+            lambda: self.bringup_service.run_vendor(
+                beni_path,
+                vince_path,
+                flumen_path,
+                rel_path,
+                log_callback=self.log_callback,
+                progress_callback=self.vendor_progress_callback,
+                error_callback=self._enhanced_error_callback,
+            ),
+            self.vendor_progress,
+            self.vendor_start_btn,
+            "Processing: Running vendor bring up operation...",
+            "Vendor Bringup Error",
+            "Mode: Bring up - Vendor operation completed",
+        )
 
     def _run_system_process(self, beni_input, vince_input, flumen_input, rel_input):
         """Run FIXED system bringup process that processes ALL auto-resolved targets"""
-        # Clear log and reset progress
-        self.gui_utils.clear_text_widget(self.log_text)
-        self.gui_utils.reset_progress(self.system_progress)
+        self._run_job(
+            lambda: self.bringup_service.run_system(
+                beni_input,
+                vince_input,
+                flumen_input,
+                rel_input,
+                log_callback=self.log_callback,
+                progress_callback=self.system_progress_callback,
+                error_callback=self.gui_utils.error_callback,
+                continue_callback=self._ask_yes_no_threadsafe,
+            ),
+            self.system_progress,
+            self.system_start_btn,
+            "Processing: Running FIXED system bring up with ALL auto-resolved targets...",
+            "System Bringup Error",
+            "Mode: Bring up - FIXED System operation completed",
+            banner=_SYSTEM_BANNER,
+        )
 
-        # Log P4 configuration info
-        client_name = get_client_name()
-        workspace_root = get_workspace_root()
-        if client_name and workspace_root:
-            self.log_callback(f"[CONFIG] Using P4 Client: {client_name}")
-            self.log_callback(f"[CONFIG] Using Workspace: {workspace_root}")
+    def _run_job(self, run, progress_widget, start_button, start_status, error_title, done_status,
+                 banner=None):
+        """Queue a bringup run on the run worker
 
-        # Log enhancement info
-        self.log_callback("[SYSTEM] Using FIXED system process with:")
-        self.log_callback("[ENHANCEMENT] FIXED auto-resolve with correct p4 filelog -i <path>#1 parsing")
-        self.log_callback("[ENHANCEMENT] FIXED target processing - ALL auto-resolved targets will be processed")
-        self.log_callback("[ENHANCEMENT] Enhanced Samsung vendor path filtering with priority logic")
-        self.log_callback("[ENHANCEMENT] Mixed input support (depot paths + workspaces)")
-        self.log_callback("[ENHANCEMENT] Improved workspace resolution using parse_process.py approach")
+        run is called on the worker and returns the service result; the start
+        button is re-enabled with done_status once it finishes.
+        """
+        # Reset progress; the log keeps earlier runs below a separator
+        self.gui_utils.reset_progress(progress_widget)
 
-        # Disable start button during processing
-        self.system_start_btn.configure(state="disabled")
+        self._log_p4_config()
+        if banner:
+            self.log_callback(banner)
 
-        def run_process_thread():
+        def run_process():
+            if self._closing.is_set():
+                # Queued behind a run when the window closed
+                return
             try:
-                self.gui_utils.update_status("Processing: Running FIXED system bring up with ALL auto-resolved targets...")
-                result = self.bringup_service.run_system(
-                    beni_input,
-                    vince_input,
-                    flumen_input,
-                    rel_input,
-                    log_callback=self.log_callback,
-                    progress_callback=self.system_progress_callback,
-                    error_callback=self.gui_utils.error_callback,
-                    continue_callback=self._ask_yes_no_threadsafe,
-                )
+                self.gui_utils.update_status(start_status)
+                result = run()
                 if not result.success:
-                    self.gui_utils.error_callback("System Bringup Error", result.message)
-            finally:
-                # Re-enable button when done
-                self.gui_utils.root.after(
-                    0, lambda: self.system_start_btn.configure(state="normal")
-                )
-                self.gui_utils.root.after(
-                    0,
-                    lambda: self.gui_utils.update_status("Mode: Bring up - FIXED System operation completed"),
-                )
+                    self.gui_utils.error_callback(error_title, result.message)
+            except Exception as e:
+                if not self._closing.is_set():
+                    self.gui_utils.error_callback("Bringup Error", str(e))
+            if not self._closing.is_set():
+                self.gui_utils.root.after(0, self._restore_after_run, start_button, done_status)
+
+        self._run_jobs.put(run_process)
 
-        # Start the process in a separate thread
-        thread = threading.Thread(target=run_process_thread, daemon=True)
-        thread.start()
+    def _restore_after_run(self, start_button, status_message):
+        """Re-enable the start button and report completion in one UI event"""
+        start_button.configure(state="normal")
+        self.gui_utils.update_status(status_message)
 
     def _ask_yes_no_threadsafe(self, title, message):
         return self.gui_utils.ask_yes_no_threadsafe(title, message)
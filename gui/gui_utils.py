@@ -3,6 +3,7 @@ GUI utilities and shared callback functions
 Handles thread-safe GUI operations, logging, and error dialogs
 """
 
+from collections import deque
 import tkinter as tk
 import threading
 from tkinter import messagebox, simpledialog
@@ -11,6 +12,15 @@ from tkinter import messagebox, simpledialog
 class GUIUtils:
     """Utility class for GUI operations and callbacks"""
 
+    # Delay before queued log lines are flushed to their text widget
+    LOG_FLUSH_MS = 50
+    # Minimum delay between progress bar updates (about 30 per second)
+    PROGRESS_FLUSH_MS = 33
+    # Re-check interval while a widget with a pending update is hidden
+    HIDDEN_RETRY_MS = 250
+    # Lines kept in a log widget (and messages kept queued); older ones are dropped
+    LOG_MAX_LINES = 5000
+
     def __init__(self, root):
         self.root = root
         self.status_var = None
@@ -20,22 +30,76 @@ class GUIUtils:
         self.status_var = status_var
 
     def create_log_callback(self, log_text_widget):
-        """Create a thread-safe logging callback for a text widget"""
-        def log_callback(msg):
-            def update_log():
-                log_text_widget.insert(tk.END, msg + "\n")
+        """Create a thread-safe logging callback for a text widget
+
+        Messages are queued and written in one insert per LOG_FLUSH_MS tick, so a
+        burst of log lines costs one widget update instead of one per line.
+        While the widget is not viewable (its tab is hidden) messages stay queued
+        and are written once it is shown again. Both the queue and the widget
+        keep only the newest LOG_MAX_LINES entries.
+        """
+        max_lines = self.LOG_MAX_LINES
+        pending = deque(maxlen=max_lines)
+        drain_lock = threading.Lock()
+        drain_scheduled = [False]
+
+        def drain_log():
+            if not log_text_widget.winfo_viewable():
+                # Hidden tab: keep the backlog and look again a little later
+                self.root.after(self.HIDDEN_RETRY_MS, drain_log)
+                return
+            with drain_lock:
+                drain_scheduled[0] = False
+            messages = []
+            while True:
+                try:
+                    messages.append(pending.popleft())
+                except IndexError:
+                    break
+            if messages:
+                log_text_widget.configure(state="normal")
+                log_text_widget.insert(tk.END, "\n".join(messages) + "\n")
+                # The text ends with a newline, so "end-1c" sits on an empty last line
+                excess = int(log_text_widget.index("end-1c").split(".")[0]) - 1 - max_lines
+                if excess > 0:
+                    log_text_widget.delete("1.0", f"{excess + 1}.0")
+                log_text_widget.configure(state="disabled")
                 log_text_widget.see(tk.END)
-                self.root.update_idletasks()
-            self.root.after(0, update_log)
+
+        def log_callback(msg):
+            pending.append(msg)
+            with drain_lock:
+                if drain_scheduled[0]:
+                    return
+                drain_scheduled[0] = True
+            self.root.after(self.LOG_FLUSH_MS, drain_log)
         return log_callback
 
     def create_progress_callback(self, progress_widget):
-        """Create a thread-safe progress update callback"""
+        """Create a thread-safe progress update callback
+
+        Updates are coalesced: at most one widget update per PROGRESS_FLUSH_MS
+        tick, always showing the latest value, so the final value is never lost.
+        While the bar is not viewable only the latest value is kept.
+        """
+        latest = [None]
+        latest_lock = threading.Lock()
+
+        def update_progress():
+            if not progress_widget.winfo_viewable():
+                # Hidden tab: later values overwrite the pending one until shown
+                self.root.after(self.HIDDEN_RETRY_MS, update_progress)
+                return
+            with latest_lock:
+                value, latest[0] = latest[0], None
+            progress_widget["value"] = value
+
         def progress_callback(value):
-            def update_progress():
-                progress_widget["value"] = value
-                self.root.update_idletasks()
-            self.root.after(0, update_progress)
+            with latest_lock:
+                scheduled = latest[0] is not None
+                latest[0] = value
+            if not scheduled:
+                self.root.after(self.PROGRESS_FLUSH_MS, update_progress)
         return progress_callback
 
     def error_callback(self, title, message):
@@ -98,22 +162,36 @@ class GUIUtils:
             self.status_var.set(message)
 
     def clear_text_widget(self, text_widget):
-        """Clear a text widget"""
-        text_widget.delete("1.0", tk.END)
+        """Clear a text widget; an already empty widget is left untouched"""
+        if text_widget.compare("end-1c", "!=", "1.0"):
+            text_widget.configure(state="normal")
+            text_widget.delete("1.0", tk.END)
+            text_widget.configure(state="disabled")
 
     def reset_progress(self, progress_widget):
-        """Reset progress bar to 0"""
-        progress_widget["value"] = 0
+        """Reset progress bar to 0 unless it is already there"""
+        if float(progress_widget["value"]):
+            progress_widget["value"] = 0
 
     def create_text_with_scrollbar(self, parent, height=20, bg="#1e1e1e", fg="#00ff88"):
-        """Create a text widget with scrollbar"""
+        """Create a log text widget with scrollbars
+
+        Lines are not wrapped, so Tk never re-flows long log output when lines are
+        appended or the window is resized; long lines scroll horizontally instead.
+        The widget is read-only with no undo history; the log callback and
+        clear_text_widget enable it only around their own edits.
+        """
         text_frame = ttk.Frame(parent)
         text_frame.pack(fill="both", expand=True)
 
         text_widget = tk.Text(
             text_frame,
             height=height,
-            wrap="word",
+            wrap="none",
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            state="disabled",
             bg=bg,
             fg=fg,
             font=("Consolas", 9),
@@ -121,10 +199,16 @@ class GUIUtils:
         scrollbar = ttk.Scrollbar(
             text_frame, orient="vertical", command=text_widget.yview
         )
-        text_widget.configure(yscrollcommand=scrollbar.set)
+        h_scrollbar = ttk.Scrollbar(
+            text_frame, orient="horizontal", command=text_widget.xview
+        )
+        text_widget.configure(
+            yscrollcommand=scrollbar.set, xscrollcommand=h_scrollbar.set
+        )
 
-        text_widget.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        h_scrollbar.pack(side="bottom", fill="x")
+        text_widget.pack(side="left", fill="both", expand=True)
 
         return text_widget
 
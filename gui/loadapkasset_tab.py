@@ -8,6 +8,7 @@ from tkinter import ttk, messagebox
 import threading
 from core.p4_operations import (
     map_single_depot,
+    reset_p4_caches,
     sync_file_silent,
     validate_depot_path,
 )
@@ -541,6 +542,9 @@ class LoadApkAssetTab:
 
     def on_start_loadapkasset(self):
         """Handle start LoadApkAsset button click"""
+        # Server state may have changed since the last run
+        reset_p4_caches()
+
         # Validate inputs
         inputs = self.validate_inputs()
         if not inputs:
@@ -6,7 +6,8 @@ Updated to support enhanced 3-path tuning functionality, System bringup, Readahe
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from config.p4_config import initialize_p4_config, check_p4_login_status, p4_login
+from config.p4_config import initialize_p4_config, check_p4_login_status, p4_login, refresh_p4_config
+from core.p4_operations import clear_integration_cache, reset_p4_caches
 from gui.bringup_tab import BringupTab
 from gui.tuning_tab import TuningTab
 from gui.parse_tab import ParseTab
@@ -15,6 +16,15 @@ from gui.loadapkasset_tab import LoadApkAssetTab
 from gui.gui_utils import GUIUtils
 from gui.login_dialog import show_login_dialog
 
+# Tab component class per mode
+TAB_CLASSES = {
+    "bringup": BringupTab,
+    "tuning": TuningTab,
+    "parse": ParseTab,
+    "readahead": ReadaheadTab,
+    "loadapkasset": LoadApkAssetTab,
+}
+
 
 class BringupToolGUI:
     """Main GUI class for the Tuning Tool with Parse Mode, Enhanced Tuning, Readahead, and LoadApkAsset"""
@@ -40,12 +50,8 @@ class BringupToolGUI:
         # Initialize GUI utilities
         self.gui_utils = GUIUtils(self.root)
 
-        # Initialize tab components
-        self.bringup_tab = None
-        self.tuning_tab = None
-        self.parse_tab = None
-        self.readahead_tab = None
-        self.loadapkasset_tab = None
+        # Tab components by mode, built on first use; see get_tab()
+        self.tabs = {}
 
         # Create GUI components
         self.create_navbar()
@@ -55,6 +61,9 @@ class BringupToolGUI:
         # Set default mode
         self.switch_mode("bringup")
 
+        # Stop background workers together with the window
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
     def create_navbar(self):
         """Create navigation tabs"""
         # Create navbar frame
@@ -88,12 +97,12 @@ class BringupToolGUI:
         self.main_frame = ttk.Frame(self.root)
         self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-        # Initialize tab components
-        self.bringup_tab = BringupTab(self.main_frame, self.gui_utils)
-        self.tuning_tab = TuningTab(self.main_frame, self.gui_utils)
-        self.parse_tab = ParseTab(self.main_frame, self.gui_utils)
-        self.readahead_tab = ReadaheadTab(self.main_frame, self.gui_utils)
-        self.loadapkasset_tab = LoadApkAssetTab(self.main_frame, self.gui_utils)
+    def get_tab(self, mode):
+        """Return the tab component for a mode, building its widgets the first time"""
+        tab = self.tabs.get(mode)
+        if tab is None:
+            tab = self.tabs[mode] = TAB_CLASSES[mode](self.main_frame, self.gui_utils)
+        return tab
 
     def create_status_bar(self):
         """Create status bar"""
@@ -111,6 +120,12 @@ class BringupToolGUI:
         clear_btn = ttk.Button(status_frame, text="Clear", command=self.on_clear)
         clear_btn.pack(side="right", padx=5, pady=2)
 
+        # Refresh button: forget cached P4 lookups kept across runs
+        refresh_btn = ttk.Button(
+            status_frame, text="Refresh P4", command=self.on_refresh_p4_cache
+        )
+        refresh_btn.pack(side="right", padx=5, pady=2)
+
         # Set status variable in GUI utils
         self.gui_utils.set_status_var(self.status_var)
 
@@ -139,43 +154,44 @@ class BringupToolGUI:
             widget.pack_forget()
 
         if mode == "bringup":
-            self.bringup_tab.show()
+            self.get_tab("bringup").show()
             self.status_var.set(
                 "Mode: Bring up - Vendor: depot paths | System: workspaces (TEMPLATE_*)"
             )
         elif mode == "tuning":
-            self.tuning_tab.show()
+            self.get_tab("tuning").show()
             self.status_var.set(
                 "Mode: Tuning value - Load properties from BENI, FLUMEN, and REL paths"
             )
         elif mode == "parse":
-            self.parse_tab.show()
+            self.get_tab("parse").show()
             self.status_var.set(
                 "Mode: Parse - Calculate library size"
             )
         elif mode == "readahead":
-            self.readahead_tab.show()
+            self.get_tab("readahead").show()
             self.status_var.set(
                 "Mode: Readahead - Configure REL/FLUMEN/BENI workspaces and libraries for rscmgr.rc modification"
             )
         elif mode == "loadapkasset":
-            self.loadapkasset_tab.show()
+            self.get_tab("loadapkasset").show()
             self.status_var.set(
                 "Mode: LoadApkAsset - Add asset apps to chipsets in ReadaheadManager.java"
             )
 
     def on_clear(self):
         """Clear all input fields based on current mode"""
-        if self.current_mode.get() == "bringup":
-            self.bringup_tab.clear_all()
-        elif self.current_mode.get() == "tuning":
-            self.tuning_tab.clear_all()
-        elif self.current_mode.get() == "parse":
-            self.parse_tab.clear_all()
-        elif self.current_mode.get() == "readahead":
-            self.readahead_tab.clear_all()
-        elif self.current_mode.get() == "loadapkasset":
-            self.loadapkasset_tab.clear_all()
+        self.get_tab(self.current_mode.get()).clear_all()
+
+    def on_refresh_p4_cache(self):
+        """Reload the client spec and forget cached P4 lookups"""
+        clear_integration_cache()
+        reset_p4_caches()
+        success, message = refresh_p4_config()
+        if not success:
+            messagebox.showerror("P4 Configuration Error", message)
+            return
+        self.status_var.set("P4 caches cleared - next run queries the server again")
 
     def handle_p4_authentication(self):
         """Handle P4 authentication with infinite retry logic"""
@@ -201,6 +217,13 @@ class BringupToolGUI:
                 # Login failed, show error and continue loop
                 messagebox.showerror("Login Failed", "Authentication failed. Please check your password and try again.")
 
+    def on_close(self):
+        """Shut down tab workers and close the main window"""
+        bringup_tab = self.tabs.get("bringup")
+        if bringup_tab is not None:
+            bringup_tab.shutdown()
+        self.root.destroy()
+
     def run(self):
         """Start the GUI main loop"""
         self.root.mainloop()
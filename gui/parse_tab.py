@@ -6,6 +6,7 @@ Handles the parse mode UI for workspace parsing and library size calculation
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
+from core.p4_operations import reset_p4_caches
 from services.parse_service import ParseService
 
 
@@ -686,6 +687,8 @@ class ParseTab:
             )
             return
 
+        # Server state may have changed since the last run
+        reset_p4_caches()
         self._run_parse_workspaces(workspace_dict)
 
     def _run_parse_workspaces(self, workspace_dict):
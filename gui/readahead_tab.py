@@ -6,6 +6,13 @@ Handles the readahead mode UI for workspace processing and library modification
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
+from core.p4_operations import (
+    find_device_common_mk_path,
+    map_single_depot,
+    reset_p4_caches,
+    sync_file_silent,
+    validate_depot_path,
+)
 from services.readahead_service import ReadaheadService
 
 
@@ -292,13 +299,6 @@ class ReadaheadTab:
 
     def _parse_rscmgr_paths_logic(self, workspaces):
         """Parse rscmgr paths logic - simple validation only"""
-        from core.p4_operations import (
-            map_single_depot,
-            sync_file_silent,
-            validate_depot_path,
-            find_device_common_mk_path
-        )
-
         try:
             # Step 1: Find rscmgr filename from primary workspace
             self.log_callback("[PARSE] Finding rscmgr filename...")
@@ -363,8 +363,6 @@ class ReadaheadTab:
 
     def _find_and_validate_paths(self, workspaces, rscmgr_filename):
         """Find and validate rscmgr paths for all provided workspaces"""
-        from core.p4_operations import validate_depot_path
-
         for workspace_key in ["REL", "FLUMEN", "BENI"]:
             workspace = workspaces.get(workspace_key, "").strip()
             if not workspace:
@@ -430,7 +428,6 @@ class ReadaheadTab:
                     0, lambda: self.parse_button.configure(state="normal")
                 )
 
-        import threading
         thread = threading.Thread(target=continue_thread, daemon=True)
         thread.start()
 
@@ -578,6 +575,9 @@ class ReadaheadTab:
 
     def on_start_readahead(self):
         """Handle start readahead button click"""
+        # Server state may have changed since the last run
+        reset_p4_caches()
+
         # Validate inputs
         inputs = self.validate_inputs()
         if not inputs:
@@ -4,14 +4,19 @@ Handles the tuning mode UI and functionality including property management for 3
 Updated with auto-resolve functionality
 """
 
+import re
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 from config.p4_config import get_client_name, get_workspace_root
+from core.p4_operations import reset_p4_caches
 from gui.property_dialog import PropertyDialog
 from gui.comparison_dialog import ComparisonDialog  # New dialog for property comparison
 from services.tuning_service import TuningService
 
+# Accepted path inputs: a depot path (//depot/...) or a TEMPLATE_* workspace name
+_PATH_INPUT_RE = re.compile(r"//[^/\s]|TEMPLATE", re.IGNORECASE)
+
 
 class TuningTab:
     """Enhanced Tuning tab component with REL path support and auto-resolve"""
@@ -228,23 +233,23 @@ class TuningTab:
 
     def on_load_properties(self):
         """Handle load properties button click - Enhanced for 3 paths with workspace support"""
-        beni_input = self.beni_entry.get().strip()
-        flumen_input = self.flumen_entry.get().strip()
-        rel_input = self.rel_entry.get().strip()
+        # Server state may have changed since the last run
+        reset_p4_caches()
 
-        # Validation - at least one valid input is required (workspace or depot path)
-        has_beni = beni_input and (beni_input.startswith("//") or beni_input.upper().startswith("TEMPLATE"))
-        has_flumen = flumen_input and (flumen_input.startswith("//") or flumen_input.upper().startswith("TEMPLATE"))
-        has_rel = rel_input and (rel_input.startswith("//") or rel_input.upper().startswith("TEMPLATE"))
+        values = {
+            name: getattr(self, f"{name}_entry").get().strip()
+            for name in ("beni", "flumen", "rel")
+        }
 
-        if not has_beni and not has_flumen and not has_rel:
+        # Validation - at least one valid input is required (workspace or depot path)
+        if not any(_PATH_INPUT_RE.match(value) for value in values.values()):
             messagebox.showerror(
                 "No Valid Inputs",
                 "At least one valid input (workspace name starting with TEMPLATE_* or depot path starting with //depot/...) is required."
             )
             return
 
-        self._load_properties_enhanced(beni_input, flumen_input, rel_input)
+        self._load_properties_enhanced(values["beni"], values["flumen"], values["rel"])
 
     def _load_properties_enhanced(self, beni_path, flumen_path, rel_path):
         """Load properties from 3 paths and handle comparison"""
@@ -376,6 +381,8 @@ class TuningTab:
         if not messagebox.askyesno(confirmation.title, confirmation.message):
             return
 
+        # Server state may have changed since the properties were loaded
+        reset_p4_caches()
         self._run_apply_tuning_enhanced_with_auto_resolve(current_properties, original_depot_paths)
 
     def _run_apply_tuning_enhanced_with_auto_resolve(self, current_properties, original_depot_paths):
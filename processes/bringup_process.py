@@ -5,6 +5,7 @@ Enhanced to support mixed input (depot paths and workspaces)
 Updated logic: Compare properties first, then create changelist only when needed
 """
 from core.p4_operations import (
+    _map_client_depots_core,
     validate_depot_path,
     map_client_two_paths, checkout_file_silent,
     is_workspace_like, sync_file_silent, create_changelist_silent,
@@ -19,12 +20,10 @@ from config.p4_config import depot_to_local_path
 
 def map_client_four_paths(beni_depot, vince_depot, flumen_depot, rel_depot, log_callback):
     """Map four depots to client spec - WRAPPER for backward compatibility"""
-    from core.p4_operations import _map_client_depots_core
     _map_client_depots_core([beni_depot, vince_depot, flumen_depot, rel_depot], log_callback)
 
 def map_client_three_paths(depot1, vince_depot, depot2, log_callback):
     """Map three depots to client spec - WRAPPER for backward compatibility"""
-    from core.p4_operations import _map_client_depots_core
     _map_client_depots_core([depot1, vince_depot, depot2], log_callback)
 
 def resolve_vendor_input_to_depot_path(user_input, log_callback=None):
@@ -5,7 +5,6 @@ Handles workspace parsing to find device_common.mk files and library size calcul
 
 import re
 import subprocess, os
-from P4 import P4, P4Exception
 from core.p4_operations import find_device_common_mk_path
 from adb_wrapper import run_adb_command  # Thêm import này
 
@@ -14,7 +14,7 @@ from core.p4_operations import (
     map_single_depot, sync_file_silent, checkout_file_silent,
     validate_device_common_mk_path, validate_depot_path,
     is_workspace_like, auto_resolve_missing_branches, find_device_common_mk_path,
-    get_integration_source_depot_path
+    get_integration_source_depot_path, get_integration_sources_bulk
 )
 from core.p4_client import get_default_p4_client
 from processes.system_process import (
@@ -810,8 +810,11 @@ def get_cascaded_paths_from_integration(current_device_common_path, current_andr
         if log_callback:
             log_callback(f"[CASCADE] Getting integration paths for {branch}...")
         
-        integrated_device_common = get_integration_source_depot_path(current_device_common_path, log_callback)
-        integrated_android_mk = get_integration_source_depot_path(current_android_mk_path, log_callback)
+        sources = get_integration_sources_bulk(
+            [current_device_common_path, current_android_mk_path], log_callback
+        )
+        integrated_device_common = sources.get(current_device_common_path)
+        integrated_android_mk = sources.get(current_android_mk_path)
         
         if not integrated_device_common or not integrated_android_mk:
             if log_callback:
@@ -22,7 +22,7 @@ from core.p4_operations import (
     map_single_depot, sync_file_silent, checkout_file_silent,
     validate_device_common_mk_path, validate_depot_path,
     is_workspace_like, auto_resolve_missing_branches, 
-    find_device_common_mk_path, get_integration_source_depot_path
+    find_device_common_mk_path, get_integration_sources_bulk
 )
 from core.p4_client import get_default_p4_client
 from config.p4_config import depot_to_local_path
@@ -674,13 +674,12 @@ def run_system_process(beni_input, vince_input, flumen_input, rel_input,
                     
                     log_callback(f"\n[CASCADE] Finding {branch_name} paths from integration history...")
                     
-                    # Get integration sources
-                    integrated_device_common = get_integration_source_depot_path(
-                        current_device_common_path, log_callback
-                    )
-                    integrated_android_mk = get_integration_source_depot_path(
-                        current_android_mk_path, log_callback
+                    # Get integration sources of both files in one P4 call
+                    sources = get_integration_sources_bulk(
+                        [current_device_common_path, current_android_mk_path], log_callback
                     )
+                    integrated_device_common = sources.get(current_device_common_path)
+                    integrated_android_mk = sources.get(current_android_mk_path)
                     
                     if not integrated_device_common or not integrated_android_mk:
                         error_msg = f"Cannot find integration paths for {branch_name}"
@@ -2,6 +2,8 @@ import sys
 import types
 from pathlib import Path
 
+import pytest
+
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -24,3 +26,9 @@ if "P4" not in sys.modules:
     stub.P4 = _StubP4
     stub.P4Exception = _StubP4Exception
     sys.modules["P4"] = stub
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path / "appdata"))
+    yield tmp_path / "appdata"
@@ -0,0 +1,199 @@
+import queue
+import threading
+
+import pytest
+
+from gui.bringup_tab import _RUN_SEPARATOR, BringupTab
+
+
+class FakeButton:
+    def __init__(self):
+        self.state = "normal"
+        self.history = []
+
+    def instate(self, states):
+        return states == [self.state]
+
+    def configure(self, state):
+        self.state = state
+        self.history.append(state)
+
+
+def test_guarded_start_ignores_clicks_while_a_start_is_in_flight():
+    tab = BringupTab.__new__(BringupTab)
+    tab.log_callback = lambda message: None
+    button = FakeButton()
+    calls = []
+
+    def start():
+        calls.append("start")
+        tab._guarded_start(button, start)  # re-entrant click
+        return True
+
+    tab._guarded_start(button, start)
+
+    assert calls == ["start"]
+    assert button.state == "disabled"
+
+
+def test_guarded_start_re_enables_button_when_nothing_was_launched():
+    tab = BringupTab.__new__(BringupTab)
+    messages = []
+    tab.log_callback = messages.append
+    button = FakeButton()
+
+    tab._guarded_start(button, lambda: None)
+
+    assert button.history == ["disabled", "normal"]
+    assert len(messages) == 1
+    assert messages[0].startswith(_RUN_SEPARATOR.split("%s")[0])
+
+
+class FakeEntry:
+    def __init__(self, text):
+        self.text = text
+
+    def get(self):
+        return self.text
+
+
+def test_read_entries_strips_each_branch_input():
+    entries = {"BENI": FakeEntry(""), "VINCE": FakeEntry("  TEMPLATE_V \n"), "REL": FakeEntry("//depot/r")}
+
+    assert BringupTab._read_entries(entries) == {"BENI": "", "VINCE": "TEMPLATE_V", "REL": "//depot/r"}
+
+
+def test_require_reports_missing_and_invalid_inputs(monkeypatch):
+    errors = []
+    monkeypatch.setattr("gui.bringup_tab.messagebox.showerror", lambda title, message: errors.append(message))
+    tab = BringupTab.__new__(BringupTab)
+
+    assert tab._require("VINCE", "", "VINCE is mandatory") is None
+    assert tab._require("VINCE", "TEMPLATE_V", "unused") == "TEMPLATE_V"
+    assert tab._require("VINCE", "//bad", "unused", lambda: (False, "", None)) is None
+    assert tab._require("VINCE", "//ok", "unused", lambda: (True, "//ok/device_common.mk", None)) == "//ok/device_common.mk"
+    assert errors == ["VINCE is mandatory", "VINCE validation failed"]
+
+
+def test_check_formats_reports_all_malformed_inputs_at_once(monkeypatch):
+    errors = []
+    monkeypatch.setattr("gui.bringup_tab.messagebox.showerror", lambda title, message: errors.append(message))
+    inputs = {"BENI": "", "VINCE": "TEMPLATE_V", "FLUMEN": "flumen", "REL": "rel"}
+
+    assert BringupTab._check_formats(inputs, "{} is malformed") is False
+    assert BringupTab._check_formats({**inputs, "FLUMEN": "//depot/f", "REL": ""}, "{} is malformed") is True
+    assert errors == ["FLUMEN is malformed\nREL is malformed"]
+
+
+class FakeGUIUtils:
+    def __init__(self):
+        self.events = []
+        self.root = self
+
+    def after(self, delay, callback, *args):
+        callback(*args)
+
+    def reset_progress(self, progress_widget):
+        self.events.append(("reset", progress_widget))
+
+    def update_status(self, message):
+        self.events.append(("status", message))
+
+    def error_callback(self, title, message):
+        self.events.append(("error", title, message))
+
+
+class FakeResult:
+    def __init__(self, success, message=""):
+        self.success = success
+        self.message = message
+
+
+def _tab_with_workers():
+    tab = BringupTab.__new__(BringupTab)
+    tab.gui_utils = FakeGUIUtils()
+    tab.log_callback = lambda message: None
+    tab._run_jobs = queue.Queue()
+    tab._validation_jobs = queue.Queue()
+    tab._closing = threading.Event()
+    tab._start_workers()
+    return tab
+
+
+def test_run_job_reports_failure_and_restores_button(monkeypatch):
+    monkeypatch.setattr("gui.bringup_tab.get_client_name", lambda: None)
+    tab = _tab_with_workers()
+    button = FakeButton()
+    button.configure("disabled")
+
+    tab._run_job(lambda: FakeResult(False, "boom"), "bar", button, "running", "Run Error", "done")
+    tab._run_jobs.join()
+
+    assert tab.gui_utils.events == [
+        ("reset", "bar"),
+        ("status", "running"),
+        ("error", "Run Error", "boom"),
+        ("status", "done"),
+    ]
+    assert button.state == "normal"
+
+
+def test_runs_share_one_persistent_daemon_worker(monkeypatch):
+    monkeypatch.setattr("gui.bringup_tab.get_client_name", lambda: None)
+    tab = _tab_with_workers()
+    workers = []
+
+    def run():
+        workers.append(threading.current_thread())
+        return FakeResult(True)
+
+    for _ in range(2):
+        tab._run_job(run, "bar", FakeButton(), "running", "Run Error", "done")
+    tab._run_jobs.join()
+
+    assert len(workers) == 2
+    assert workers[0] is workers[1]
+    assert workers[0].daemon
+
+
+def test_run_job_stays_quiet_once_the_window_is_closing(monkeypatch):
+    monkeypatch.setattr("gui.bringup_tab.get_client_name", lambda: None)
+    tab = _tab_with_workers()
+    button = FakeButton()
+    button.configure("disabled")
+    release = threading.Event()
+    calls = []
+
+    tab._run_jobs.put(release.wait)  # a previous run is still going
+    tab._run_job(lambda: calls.append("run"), "bar", button, "running", "Run Error", "done")
+    tab._closing.set()
+    release.set()
+    tab._run_jobs.join()
+
+    assert calls == []
+    assert tab.gui_utils.events == [("reset", "bar")]
+    assert button.state == "disabled"
+
+
+def test_submit_validation_returns_results_and_errors():
+    tab = _tab_with_workers()
+
+    def fail():
+        raise RuntimeError("no such workspace")
+
+    assert tab._submit_validation(lambda a, b: a + b, 2, 3).result(timeout=5) == 5
+    with pytest.raises(RuntimeError, match="no such workspace"):
+        tab._submit_validation(fail).result(timeout=5)
+
+
+def test_validate_system_input_rejects_unknown_workspace(monkeypatch):
+    def find_device_common(workspace):
+        raise RuntimeError(f"Workspace not found: {workspace}")
+
+    monkeypatch.setattr("gui.bringup_tab.find_device_common_mk_path", find_device_common)
+    tab = BringupTab.__new__(BringupTab)
+
+    is_valid, resolved, error = tab._validate_system_input("TEMPLATE_TYPO", "VINCE")
+
+    assert (is_valid, resolved) == (False, "")
+    assert error == "VINCE workspace resolution failed: Workspace not found: TEMPLATE_TYPO"
@@ -0,0 +1,185 @@
+from gui.gui_utils import GUIUtils
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append((delay, callback))
+
+    def run_pending(self):
+        scheduled, self.scheduled = self.scheduled, []
+        for _, callback in scheduled:
+            callback()
+
+
+class FakeText:
+    def __init__(self):
+        self.text = ""
+        self.inserts = []
+        self.seen = 0
+        self.deletes = 0
+        self.viewable = True
+        self.state = "disabled"
+
+    def configure(self, state):
+        self.state = state
+
+    def winfo_viewable(self):
+        return self.viewable
+
+    def insert(self, index, text):
+        assert self.state == "normal"
+        self.inserts.append(text)
+        self.text += text
+
+    def see(self, index):
+        self.seen += 1
+
+    def index(self, index):
+        assert index == "end-1c"
+        return f"{self.text.count(chr(10)) + 1}.0"
+
+    def compare(self, index1, op, index2):
+        assert (index1, op, index2) == ("end-1c", "!=", "1.0")
+        return bool(self.text)
+
+    def delete(self, start, end):
+        assert self.state == "normal"
+        self.deletes += 1
+        if end == "end":
+            self.text = ""
+        else:
+            first_kept = int(end.split(".")[0])
+            self.text = "".join(self.text.splitlines(keepends=True)[first_kept - 1:])
+
+
+class FakeProgress(dict):
+    def __init__(self, value):
+        super().__init__(value=value)
+        self.writes = 0
+        self.viewable = True
+
+    def winfo_viewable(self):
+        return self.viewable
+
+    def __setitem__(self, key, value):
+        self.writes += 1
+        super().__setitem__(key, value)
+
+
+def test_log_callback_coalesces_messages_into_one_insert():
+    root = FakeRoot()
+    widget = FakeText()
+    log = GUIUtils(root).create_log_callback(widget)
+
+    log("[STEP 1] first")
+    log("[STEP 2] second")
+    log("[STEP 3] third")
+
+    assert [delay for delay, _ in root.scheduled] == [GUIUtils.LOG_FLUSH_MS]
+
+    root.run_pending()
+    log("[STEP 4] fourth")
+    root.run_pending()
+
+    assert widget.inserts == [
+        "[STEP 1] first\n[STEP 2] second\n[STEP 3] third\n",
+        "[STEP 4] fourth\n",
+    ]
+    assert widget.seen == 2
+    assert widget.state == "disabled"
+
+
+def test_log_callback_holds_messages_while_widget_is_hidden():
+    root = FakeRoot()
+    widget = FakeText()
+    log = GUIUtils(root).create_log_callback(widget)
+    widget.viewable = False
+
+    log("[STEP 1] first")
+    root.run_pending()
+    log("[STEP 2] second")
+
+    assert widget.inserts == []
+    assert [delay for delay, _ in root.scheduled] == [GUIUtils.HIDDEN_RETRY_MS]
+
+    widget.viewable = True
+    root.run_pending()
+
+    assert widget.inserts == ["[STEP 1] first\n[STEP 2] second\n"]
+    assert root.scheduled == []
+
+
+def test_clear_and_reset_skip_widgets_that_are_already_empty():
+    utils = GUIUtils(FakeRoot())
+    widget = FakeText()
+    idle = FakeProgress(0.0)
+    busy = FakeProgress(42.0)
+
+    utils.clear_text_widget(widget)
+    widget.text = "[STEP 1] first\n"
+    utils.clear_text_widget(widget)
+    utils.reset_progress(idle)
+    utils.reset_progress(busy)
+
+    assert widget.deletes == 1
+    assert widget.text == ""
+    assert idle.writes == 0
+    assert busy["value"] == 0
+
+
+def test_log_widget_keeps_only_the_newest_lines(monkeypatch):
+    monkeypatch.setattr(GUIUtils, "LOG_MAX_LINES", 3)
+    root = FakeRoot()
+    widget = FakeText()
+    log = GUIUtils(root).create_log_callback(widget)
+
+    log("one")
+    log("two")
+    root.run_pending()
+    for message in ("three", "four", "five", "six", "seven"):
+        log(message)
+    root.run_pending()
+
+    assert widget.text == "five\nsix\nseven\n"
+
+
+def test_progress_callback_applies_only_the_latest_value_per_tick():
+    root = FakeRoot()
+    bar = FakeProgress(0)
+    progress = GUIUtils(root).create_progress_callback(bar)
+
+    for value in (10, 20, 30):
+        progress(value)
+
+    assert [delay for delay, _ in root.scheduled] == [GUIUtils.PROGRESS_FLUSH_MS]
+
+    root.run_pending()
+    progress(100)
+    root.run_pending()
+
+    assert bar.writes == 2
+    assert bar["value"] == 100
+
+
+def test_progress_callback_holds_the_latest_value_while_hidden():
+    root = FakeRoot()
+    bar = FakeProgress(0)
+    bar.viewable = False
+    progress = GUIUtils(root).create_progress_callback(bar)
+
+    progress(40)
+    root.run_pending()
+    progress(70)
+
+    assert bar.writes == 0
+    assert [delay for delay, _ in root.scheduled] == [GUIUtils.HIDDEN_RETRY_MS]
+
+    bar.viewable = True
+    root.run_pending()
+
+    assert bar.writes == 1
+    assert bar["value"] == 70
+    assert root.scheduled == []
@@ -25,6 +25,7 @@ def test_run_builds_argument_list_without_shell(monkeypatch):
     assert output.startswith("//depot/path/file#1")
     assert calls[0][0] == ["p4", "files", "//depot/path/file"]
     assert "shell" not in calls[0][1]
+    assert "creationflags" in calls[0][1]
     assert calls[0][1]["env"]["P4PORT"] == "test:1666"
 
 
@@ -63,3 +64,153 @@ View:
     assert parsed["Client"] == "demo_client"
     assert parsed["Root"] == "C:\\ws"
     assert parsed["View"][1].startswith("//depot/vendor")
+
+
+def test_fetch_view_depots_returns_left_side_of_view_only(monkeypatch):
+    spec = """Client: demo_client
+Root: C:\\ws
+
+View:
+\t//depot/project/... //demo_client/project/...
+\t//depot/vendor/device/a_common/... //demo_client/vendor/device/a_common/...
+ChangeView:
+\t//depot/project/...@100
+"""
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return completed(cmd, stdout=spec)
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    client = P4Client(Settings())
+
+    assert client.fetch_view_depots("demo_client") == [
+        "//depot/project/...",
+        "//depot/vendor/device/a_common/...",
+    ]
+    assert calls == [["p4", "client", "-o", "demo_client"]]
+
+
+def test_fetch_view_depots_unquotes_overlays_and_skips_exclusions(monkeypatch):
+    spec = """Client: demo_client
+
+View:
+\t//depot/project/... //demo_client/project/...
+\t-//depot/project/test/... //demo_client/project/test/...
+\t+//depot/overlay/... //demo_client/project/...
+\t"//depot/with space/..." "//demo_client/with space/..."
+\t"-//depot/with space/tmp/..." "//demo_client/with space/tmp/..."
+"""
+
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **kwargs: completed(cmd, stdout=spec))
+
+    assert P4Client(Settings()).fetch_view_depots("demo_client") == [
+        "//depot/project/...",
+        "//depot/overlay/...",
+        "//depot/with space/...",
+    ]
+
+
+def test_files_many_batches_paths_through_marshalled_output(monkeypatch):
+    import marshal
+
+    calls = []
+    records = [
+        {b"code": b"stat", b"depotFile": b"//depot/a/file.mk", b"action": b"edit"},
+        {b"code": b"error", b"data": b"//depot/b/file.mk - no such file(s).\n"},
+    ]
+
+    def fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs))
+        return subprocess.CompletedProcess(
+            args=cmd,
+            returncode=0,
+            stdout=b"".join(marshal.dumps(record) for record in records),
+            stderr=b"",
+        )
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    existing = P4Client(Settings()).files_many(["//depot/a/file.mk", "//depot/b/file.mk"])
+
+    assert existing == {"//depot/a/file.mk": True, "//depot/b/file.mk": False}
+    assert calls[0][0] == ["p4", "-G", "-x", "-", "files"]
+    assert calls[0][1]["input"] == b"//depot/a/file.mk\n//depot/b/file.mk"
+    assert len(calls) == 1  # the reported miss needs no second lookup
+
+
+def test_files_many_rechecks_paths_reported_under_another_name(monkeypatch):
+    import marshal
+
+    calls = []
+    records = [{b"code": b"stat", b"depotFile": b"//depot/A/file.mk", b"action": b"edit"}]
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if "-G" in cmd:
+            return subprocess.CompletedProcess(
+                args=cmd, returncode=0, stdout=b"".join(marshal.dumps(r) for r in records), stderr=b""
+            )
+        return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="//depot/A/file.mk#3\n", stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    existing = P4Client(Settings()).files_many(["//depot/a/file.mk"])
+
+    assert existing == {"//depot/a/file.mk": True}
+    assert calls[1] == ["p4", "files", "//depot/a/file.mk"]
+
+
+def test_sync_discards_stdout(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs))
+        return completed(cmd, stdout=None, stderr="")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    P4Client(Settings()).sync("//depot/path/...")
+
+    assert calls[0][0] == ["p4", "sync", "//depot/path/..."]
+    assert calls[0][1]["stdout"] is subprocess.DEVNULL
+    assert calls[0][1]["stderr"] is subprocess.PIPE
+    assert "capture_output" not in calls[0][1]
+
+
+def test_environment_is_built_once_per_client(monkeypatch):
+    envs = []
+
+    def fake_run(cmd, **kwargs):
+        envs.append(kwargs["env"])
+        return completed(cmd, stdout="ok")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    client = P4Client(Settings(p4port="test:1666"))
+    client.run(["info"])
+    client.run(["info"])
+
+    assert envs[0] is envs[1]
+    assert envs[0]["P4PORT"] == "test:1666"
+
+
+def test_filelog_limits_output_to_one_revision(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return completed(cmd, stdout=b"" if "-G" in cmd else "")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    client = P4Client(Settings())
+    client.filelog("//depot/a.mk#1")
+    client.filelog_records("//depot/a.mk#1")
+
+    assert calls == [
+        ["p4", "filelog", "-m", "1", "-i", "//depot/a.mk#1"],
+        ["p4", "-G", "filelog", "-m", "1", "-i", "//depot/a.mk#1"],
+    ]
@@ -0,0 +1,710 @@
+import pytest
+
+from core import p4_operations
+
+
+@pytest.fixture(autouse=True)
+def reset_p4_caches_between_tests(monkeypatch):
+    p4_operations._VALIDATE_CACHE.clear()
+    p4_operations._find_device_common_cached.cache_clear()
+    p4_operations._INTEGRATION_SRC_CACHE.clear()
+    monkeypatch.setattr(p4_operations, "_PERSISTED_INTEGRATION_SRC", None)
+    monkeypatch.setattr(p4_operations, "_PERSISTED_INTEGRATION_DIRTY", False)
+    yield
+    p4_operations._VALIDATE_CACHE.clear()
+    p4_operations._find_device_common_cached.cache_clear()
+    p4_operations._INTEGRATION_SRC_CACHE.clear()
+
+
+def test_resolve_user_input_shares_the_workspace_lookup_cache(monkeypatch):
+    calls = []
+
+    class FakeClient:
+        def fetch_view_depots(self, workspace_name):
+            calls.append(workspace_name)
+            return ["//depot/vendor/device/a_common/..."]
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+
+    first = p4_operations.resolve_user_input_to_depot_path(" TEMPLATE_A ")
+    second = p4_operations.resolve_user_input_to_depot_path("TEMPLATE_A")
+    p4_operations.find_device_common_mk_path("TEMPLATE_A")
+
+    assert first == second == "//depot/vendor/device/a_common/device_common.mk"
+    assert calls == ["TEMPLATE_A"]
+    assert p4_operations.resolve_user_input_to_depot_path("//depot/x") == "//depot/x"
+
+
+def test_map_client_depots_core_replaces_existing_mappings(monkeypatch):
+    spec = "Client: demo\n\nView:\n\t//depot/old/... //demo/old/...\n\t//depot/a/file.mk\t//demo/depot/a/file.mk"
+    written = {}
+
+    def fake_run_cmd(cmd, input_text=None, discard_stdout=False):
+        if input_text is not None:
+            written["spec"] = input_text
+            written["discard_stdout"] = discard_stdout
+            return ""
+        return spec
+
+    monkeypatch.setattr(p4_operations, "get_client_name", lambda: "demo")
+    monkeypatch.setattr(p4_operations, "run_cmd", fake_run_cmd)
+
+    p4_operations._map_client_depots_core(["//depot/a/file.mk", "//depot/b/file.mk"], silent=True)
+
+    assert written["spec"].splitlines() == [
+        "Client: demo",
+        "",
+        "View:",
+        "\t//depot/old/... //demo/old/...",
+        "\t//depot/a/file.mk\t//demo/depot/a/file.mk",
+        "\t//depot/b/file.mk\t//demo/depot/b/file.mk",
+    ]
+    assert written["discard_stdout"] is True
+
+
+def test_classify_input_distinguishes_depot_workspace_and_literal():
+    assert p4_operations.classify_input(" //depot/a/file.mk") is p4_operations.InputKind.DEPOT
+    assert p4_operations.classify_input("template_model_rel") is p4_operations.InputKind.WORKSPACE
+    assert p4_operations.classify_input("TEMPLAT") is p4_operations.InputKind.LITERAL
+    assert p4_operations.classify_input("") is p4_operations.InputKind.LITERAL
+    assert p4_operations.is_workspace_like("TEMPLATE_A") is True
+
+
+def test_extract_device_common_from_depots_returns_first_existing(monkeypatch):
+    checked = []
+
+    class FakeClient:
+        def files_many(self, depot_paths):
+            checked.append(list(depot_paths))
+            return {path: "model2" in path for path in depot_paths}
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+
+    result = p4_operations._extract_device_common_from_depots([
+        "//depot/platform/...",
+        "//depot/vendor/model1_s/device/model1_common/...",
+        "//depot/vendor/model2_s/DEVICE/model2_common/...",
+    ])
+
+    assert result == "//depot/vendor/model2_s/device/model2_common/device_common.mk"
+    assert checked == [[
+        "//depot/vendor/model1_s/device/model1_common/device_common.mk",
+        "//depot/vendor/model2_s/device/model2_common/device_common.mk",
+    ]]
+
+
+def test_cascade_apply_issues_one_command_per_step(monkeypatch):
+    calls = []
+
+    class FakeClient:
+        def sync_many(self, depot_paths):
+            calls.append(("sync", list(depot_paths)))
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+    monkeypatch.setattr(
+        p4_operations,
+        "_map_client_depots_core",
+        lambda depot_paths, log_callback=None, silent=False: calls.append(("map", list(depot_paths))),
+    )
+
+    p4_operations._cascade_apply(["//depot/a.mk", "", "//depot/b.mk", "//depot/a.mk"])
+
+    assert calls == [
+        ("map", ["//depot/a.mk", "//depot/b.mk"]),
+        ("sync", ["//depot/a.mk", "//depot/b.mk"]),
+    ]
+
+
+def test_label_picks_branch_name_from_depot_path():
+    assert p4_operations._label("//depot/Beni/device_common.mk", "DEPOT") == "BENI"
+    assert p4_operations._label("//depot/flumen/device_common.mk", "DEPOT") == "FLUMEN"
+    assert p4_operations._label("//depot/rel/device_common.mk", "TARGET") == "TARGET"
+
+
+def test_map_client_depots_core_logs_per_call_shape(monkeypatch):
+    monkeypatch.setattr(p4_operations, "get_client_name", lambda: "demo")
+    monkeypatch.setattr(p4_operations, "run_cmd", lambda cmd, input_text=None, discard_stdout=False: "")
+
+    messages = []
+    p4_operations._map_client_depots_core(["//depot/flumen/a.mk", "//depot/vince/a.mk"], messages.append)
+    p4_operations._map_client_depots_core(["//a", "//b", "//c"], messages.append)
+
+    assert messages == [
+        "[STEP 2] Mapping FLUMEN and VINCE to client spec...",
+        "[OK] Mapping completed.",
+        "[OK] Mapping completed.",
+    ]
+
+
+def test_find_device_common_mk_path_returns_first_match_and_all_views(monkeypatch):
+    class FakeClient:
+        def fetch_view_depots(self, workspace):
+            return [
+                "//depot/platform/...",
+                "//depot/vendor/device/a_common/...",
+                "//depot/vendor/device/b_common/...",
+            ]
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+
+    path, views = p4_operations.find_device_common_mk_path("TEMPLATE_A")
+
+    assert path == "//depot/vendor/device/a_common/device_common.mk"
+    assert views == [
+        "//depot/platform/...",
+        "//depot/vendor/device/a_common/...",
+        "//depot/vendor/device/b_common/...",
+    ]
+
+
+def test_get_integration_source_depot_path_is_cached(monkeypatch):
+    calls = []
+
+    class FakeClient:
+        def filelog_records(self, depot_path):
+            calls.append(depot_path)
+            return [{
+                "code": "stat",
+                "depotFile": "//depot/rel/device_common.mk",
+                "rev0": "1",
+                "how0,0": "copy into",
+                "file0,0": "//depot/other/device_common.mk",
+                "how0,1": "branch from",
+                "file0,1": "//depot/flumen/device_common.mk",
+            }]
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+
+    first = p4_operations.get_integration_source_depot_path("//depot/rel/device_common.mk", None)
+    second = p4_operations.get_integration_source_depot_path("//depot/rel/device_common.mk", None)
+
+    assert first == second == "//depot/flumen/device_common.mk"
+    assert calls == ["//depot/rel/device_common.mk#1"]
+
+
+def test_auto_resolve_missing_branches_validates_cascade_in_one_call(monkeypatch):
+    sources = {
+        "//depot/rel/device_common.mk": "//depot/flumen/device_common.mk",
+        "//depot/flumen/device_common.mk": "//depot/beni/device_common.mk",
+    }
+    validated = []
+    applied = []
+
+    def fake_bulk(depot_paths):
+        validated.append(list(depot_paths))
+        return {path: True for path in depot_paths if path}
+
+    monkeypatch.setattr(
+        p4_operations,
+        "find_device_common_mk_path",
+        lambda workspace, log_callback=None: ("//depot/rel/device_common.mk", []),
+    )
+    monkeypatch.setattr(
+        p4_operations,
+        "get_integration_source_depot_path",
+        lambda depot_path, log_callback: sources.get(depot_path),
+    )
+    monkeypatch.setattr(p4_operations, "validate_depot_paths_bulk", fake_bulk)
+    monkeypatch.setattr(p4_operations, "_cascade_apply", lambda depot_paths, *args: applied.append(depot_paths))
+
+    result = p4_operations.auto_resolve_missing_branches(
+        "TEMPLATE_VINCE", "", "", "TEMPLATE_REL", lambda message: None
+    )
+
+    assert result == (
+        "//depot/beni/device_common.mk",
+        "//depot/flumen/device_common.mk",
+        "TEMPLATE_REL",
+        "TEMPLATE_VINCE",
+    )
+    assert validated == [[
+        "//depot/rel/device_common.mk",
+        "//depot/flumen/device_common.mk",
+        "//depot/beni/device_common.mk",
+    ]]
+    assert applied == [["//depot/rel/device_common.mk", "//depot/flumen/device_common.mk"]]
+
+
+def test_auto_resolve_missing_branches_walks_chain_from_last_given_branch(monkeypatch):
+    looked_up = []
+    applied = []
+
+    def fake_source(depot_path, log_callback):
+        looked_up.append(depot_path)
+        return "//depot/beni/device_common.mk"
+
+    monkeypatch.setattr(
+        p4_operations,
+        "find_device_common_mk_path",
+        lambda workspace, log_callback=None: ("//depot/flumen/device_common.mk", []),
+    )
+    monkeypatch.setattr(p4_operations, "get_integration_source_depot_path", fake_source)
+    monkeypatch.setattr(
+        p4_operations,
+        "validate_depot_paths_bulk",
+        lambda depot_paths: {path: True for path in depot_paths},
+    )
+    monkeypatch.setattr(p4_operations, "_cascade_apply", lambda depot_paths, *args: applied.append(depot_paths))
+
+    result = p4_operations.auto_resolve_missing_branches(
+        "TEMPLATE_VINCE", "TEMPLATE_FLUMEN", "", "TEMPLATE_REL", lambda message: None
+    )
+
+    assert result == (
+        "//depot/beni/device_common.mk",
+        "TEMPLATE_FLUMEN",
+        "TEMPLATE_REL",
+        "TEMPLATE_VINCE",
+    )
+    assert looked_up == ["//depot/flumen/device_common.mk"]
+    assert applied == [["//depot/flumen/device_common.mk"]]
+
+
+def test_validate_depot_path_uses_tagged_files_output(monkeypatch):
+    calls = []
+
+    class FakeClient:
+        def run_marshalled(self, args, arg_lines=None):
+            calls.append(args)
+            if args[1] == "//depot/exists.mk":
+                return [{"code": "stat", "depotFile": "//depot/exists.mk"}]
+            return [{"code": "error", "data": "no such file(s)."}]
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+
+    assert p4_operations.validate_depot_path("//depot/exists.mk") is True
+    assert p4_operations.validate_depot_path("//depot/missing.mk") is False
+    assert calls == [["files", "//depot/exists.mk"], ["files", "//depot/missing.mk"]]
+
+
+def test_auto_resolve_vendor_branches_resolves_rel_cascade(monkeypatch):
+    sources = {
+        "//depot/rel/device_common.mk": "//depot/flumen/device_common.mk",
+        "//depot/flumen/device_common.mk": "//depot/beni/device_common.mk",
+    }
+    applied = []
+
+    monkeypatch.setattr(
+        p4_operations,
+        "find_device_common_mk_path",
+        lambda workspace, log_callback=None: ("//depot/rel/device_common.mk", []),
+    )
+    monkeypatch.setattr(
+        p4_operations,
+        "get_integration_source_depot_path",
+        lambda depot_path, log_callback: sources.get(depot_path),
+    )
+    monkeypatch.setattr(p4_operations, "validate_depot_path", lambda depot_path: True)
+    monkeypatch.setattr(p4_operations, "map_and_sync", lambda depot_path, log_callback=None: applied.append(depot_path))
+
+    result = p4_operations.auto_resolve_vendor_branches(
+        "//depot/vince/device_common.mk", "", "", "TEMPLATE_REL", lambda message: None
+    )
+
+    assert result == (
+        "//depot/beni/device_common.mk",
+        "//depot/vince/device_common.mk",
+        "//depot/flumen/device_common.mk",
+        "TEMPLATE_REL",
+    )
+    assert sorted(applied) == ["//depot/flumen/device_common.mk", "//depot/rel/device_common.mk"]
+
+
+def test_branch_from_regex_picks_first_branch_line():
+    output = (
+        "//depot/flumen/device_common.mk\n"
+        "... #1 change 7 branch on 2024/01/01 by user@ws (text) 'init'\n"
+        "... ... copy into //depot/rel/device_common.mk#1\n"
+        "  ... ... branch from //depot/beni/device_common.mk#1,#2\n"
+        "... ... branch from //depot/other/device_common.mk#4\n"
+    )
+
+    match = p4_operations._BRANCH_FROM_RE.search(output)
+
+    assert match.group(1) == "//depot/beni/device_common.mk"
+
+
+def test_map_and_sync_skips_client_rewrite_when_already_mapped(monkeypatch):
+    spec = "Client: demo\n\nView:\n\t//depot/a/file.mk //demo/depot/a/file.mk"
+    commands = []
+    synced = []
+
+    def fake_run_cmd(cmd, input_text=None, discard_stdout=False):
+        commands.append(cmd)
+        return spec
+
+    class FakeClient:
+        def sync_many(self, depot_paths):
+            synced.append(list(depot_paths))
+
+    monkeypatch.setattr(p4_operations, "get_client_name", lambda: "demo")
+    monkeypatch.setattr(p4_operations, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+
+    p4_operations.map_and_sync("//depot/a/file.mk")
+    p4_operations.map_and_sync("//depot/a/file.mk")
+
+    # The spec is read each time but never rewritten
+    assert commands == [["p4", "client", "-o"], ["p4", "client", "-o"]]
+    assert synced == [["//depot/a/file.mk"], ["//depot/a/file.mk"]]
+
+
+def test_get_integration_source_depot_path_reuses_persisted_result(monkeypatch):
+    calls = []
+
+    class FakeClient:
+        def filelog_records(self, depot_path):
+            return []
+
+        def filelog(self, depot_path):
+            calls.append(depot_path)
+            return "... ... branch from //depot/flumen/device_common.mk#1,#3\n"
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+
+    first = p4_operations.get_integration_source_depot_path("//depot/rel/device_common.mk", None)
+    assert not p4_operations.integration_cache_path().exists()  # buffered until a flush
+    p4_operations.flush_integration_cache()
+
+    # Simulate a fresh process: only the on-disk cache survives
+    p4_operations._INTEGRATION_SRC_CACHE.clear()
+    monkeypatch.setattr(p4_operations, "_PERSISTED_INTEGRATION_SRC", None)
+    second = p4_operations.get_integration_source_depot_path("//depot/rel/device_common.mk", None)
+
+    assert first == second == "//depot/flumen/device_common.mk"
+    assert calls == ["//depot/rel/device_common.mk#1"]
+
+
+def test_persisted_integration_sources_keep_only_the_newest_entries(monkeypatch):
+    monkeypatch.setattr(p4_operations, "_PERSISTED_INTEGRATION_MAX", 2)
+
+    for name in ("a", "b", "c"):
+        p4_operations._remember_integration_source(f"//depot/{name}.mk", f"//depot/src_{name}.mk")
+    p4_operations.flush_integration_cache()
+
+    monkeypatch.setattr(p4_operations, "_PERSISTED_INTEGRATION_SRC", None)
+    assert p4_operations._persisted_integration_sources() == {
+        "//depot/b.mk": "//depot/src_b.mk",
+        "//depot/c.mk": "//depot/src_c.mk",
+    }
+
+
+def test_resolve_cascade_stops_at_first_missing_history(monkeypatch):
+    sources = {"//depot/rel/device_common.mk": "//depot/flumen/device_common.mk"}
+    looked_up = []
+
+    def fake_source(depot_path, log_callback):
+        looked_up.append(depot_path)
+        return sources.get(depot_path)
+
+    monkeypatch.setattr(p4_operations, "get_integration_source_depot_path", fake_source)
+
+    chain = list(
+        p4_operations._resolve_cascade("//depot/rel/device_common.mk", ("FLUMEN", "BENI", "EXTRA"))
+    )
+
+    assert chain == [("FLUMEN", "//depot/flumen/device_common.mk")]
+    assert looked_up == ["//depot/rel/device_common.mk", "//depot/flumen/device_common.mk"]
+
+
+def test_log_formats_only_when_callback_is_set():
+    class Loud:
+        def __str__(self):
+            raise AssertionError("formatted without a listener")
+
+    p4_operations._log(None, "[INFO] %s", Loud())
+
+    messages = []
+    p4_operations._log(messages.append, "[INFO] %s#%d", "//depot/a.mk", 1)
+    p4_operations._log(messages.append, "[INFO] 100% literal")
+
+    assert messages == ["[INFO] //depot/a.mk#1", "[INFO] 100% literal"]
+
+
+def test_auto_resolve_vendor_branches_validates_each_path_once(monkeypatch):
+    validated = []
+
+    def fake_p4_run(*args):
+        validated.append(args[1])
+        return [{"code": "stat", "depotFile": args[1]}]
+
+    monkeypatch.setattr(p4_operations, "p4_run", fake_p4_run)
+    monkeypatch.setattr(
+        p4_operations,
+        "get_integration_source_depot_path",
+        lambda depot_path, log_callback: "//depot/beni/device_common.mk",
+    )
+    monkeypatch.setattr(p4_operations, "map_and_sync", lambda depot_path, log_callback=None: None)
+
+    result = p4_operations.auto_resolve_vendor_branches(
+        "//depot/vince/device_common.mk", "", "//depot/flumen/device_common.mk", "", lambda message: None
+    )
+
+    assert result[0] == "//depot/beni/device_common.mk"
+    assert validated == ["//depot/flumen/device_common.mk", "//depot/beni/device_common.mk"]
+
+
+def test_get_integration_source_depot_path_reports_filelog_errors(monkeypatch):
+    class FakeClient:
+        def filelog_records(self, depot_path):
+            return [{"code": "error", "data": "//depot/missing.mk#1 - no such file(s).\n"}]
+
+        def filelog(self, depot_path):
+            raise AssertionError("text filelog should not run after an error record")
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+    messages = []
+
+    assert p4_operations.get_integration_source_depot_path("//depot/missing.mk", messages.append) is None
+    assert messages == ["[ERROR] Error getting integration source: //depot/missing.mk#1 - no such file(s)."]
+    assert "//depot/missing.mk" not in p4_operations._INTEGRATION_SRC_CACHE
+
+
+def test_find_device_common_mk_path_strips_only_the_view_wildcard(monkeypatch):
+    class FakeClient:
+        def fetch_view_depots(self, workspace):
+            return ["//depot/platform/...", "//depot/vendor/device/a_common/v1..."]
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+
+    path, _ = p4_operations.find_device_common_mk_path("TEMPLATE_A")
+
+    assert path == "//depot/vendor/device/a_common/v1/device_common.mk"
+
+
+def test_auto_resolve_returns_early_when_beni_is_given(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("no P4 lookups expected")
+
+    monkeypatch.setattr(p4_operations, "find_device_common_mk_path", fail)
+    monkeypatch.setattr(p4_operations, "validate_depot_path", fail)
+    monkeypatch.setattr(p4_operations, "validate_depot_paths_bulk", fail)
+
+    messages = []
+    assert p4_operations.auto_resolve_vendor_branches(
+        " VINCE ", "BENI", "", "TEMPLATE_REL", messages.append
+    ) == ("BENI", "VINCE", "", "TEMPLATE_REL")
+    assert messages[-2] == "[AUTO-RESOLVE] Final resolved values:"
+    assert "[RESOLVED] FLUMEN: (not provided)" in messages[-1]
+    assert p4_operations.auto_resolve_missing_branches(
+        "VINCE", "", "BENI", "TEMPLATE_REL", lambda message: None
+    ) == ("BENI", "", "TEMPLATE_REL", "VINCE")
+    assert p4_operations.auto_resolve_missing_branches(
+        "VINCE", "", "", "", lambda message: None
+    ) == ("", "", "", "VINCE")
+
+
+def test_cascade_seed_picks_start_of_chain_from_given_inputs():
+    branches = p4_operations.Branches.from_inputs(" VINCE ", None, "", " TEMPLATE_REL ")
+
+    assert branches == p4_operations.Branches("VINCE", "", "", "TEMPLATE_REL")
+    assert p4_operations._cascade_seed(branches) == "rel"
+    assert p4_operations._cascade_seed(p4_operations.Branches("V", "", "F", "R")) == "flumen"
+    assert p4_operations._cascade_seed(p4_operations.Branches("V", "", "F", "")) == "flumen"
+    assert p4_operations._cascade_seed(p4_operations.Branches("V", "B", "", "R")) is None
+    assert p4_operations._cascade_seed(p4_operations.Branches("V", "", "", "")) is None
+
+
+def test_auto_resolve_vendor_branches_prefetches_flumen_and_rel_workspaces(monkeypatch):
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+    resolved = []
+
+    def fake_find(workspace_name, log_callback=None):
+        # Both lookups must be in flight together to pass the barrier
+        barrier.wait()
+        resolved.append(workspace_name)
+        return f"//depot/{workspace_name.lower()}/device_common.mk", []
+
+    monkeypatch.setattr(p4_operations, "find_device_common_mk_path", fake_find)
+    monkeypatch.setattr(p4_operations, "validate_depot_path", lambda depot_path: True)
+    monkeypatch.setattr(
+        p4_operations, "get_integration_source_depot_path", lambda depot_path, log_callback: None
+    )
+    monkeypatch.setattr(p4_operations, "map_and_sync", lambda depot_path, log_callback=None: None)
+
+    result = p4_operations.auto_resolve_vendor_branches(
+        "//depot/vince/device_common.mk", "", "TEMPLATE_FLUMEN", "TEMPLATE_REL", lambda message: None
+    )
+
+    assert result == ("", "//depot/vince/device_common.mk", "TEMPLATE_FLUMEN", "TEMPLATE_REL")
+    assert sorted(resolved) == ["TEMPLATE_FLUMEN", "TEMPLATE_REL"]
+
+
+def test_find_device_common_mk_path_caches_per_workspace(monkeypatch):
+    fetched = []
+
+    class FakeClient:
+        def fetch_view_depots(self, workspace):
+            fetched.append(workspace)
+            return ["//depot/vendor/device/a_common/..."]
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+    messages = []
+
+    first = p4_operations.find_device_common_mk_path("TEMPLATE_A")
+    first[1].append("//caller/mutation/...")
+    second = p4_operations.find_device_common_mk_path("TEMPLATE_A", messages.append)
+
+    assert second == ("//depot/vendor/device/a_common/device_common.mk", ["//depot/vendor/device/a_common/..."])
+    assert fetched == ["TEMPLATE_A"]
+    assert messages[-1] == "[OK] Found device_common.mk path: //depot/vendor/device/a_common/device_common.mk"
+
+    p4_operations._find_device_common_cached.cache_clear()
+    p4_operations.find_device_common_mk_path("TEMPLATE_A")
+    assert fetched == ["TEMPLATE_A", "TEMPLATE_A"]
+
+
+def test_map_single_depot_moves_mapping_after_a_later_exclusion(monkeypatch):
+    spec = (
+        "Client: demo\n\nView:\n"
+        "\t//depot/a/file.mk //demo/depot/a/file.mk\n"
+        "\t-//depot/a/... //demo/depot/a/..."
+    )
+    written = []
+
+    monkeypatch.setattr(p4_operations, "get_client_name", lambda: "demo")
+    monkeypatch.setattr(p4_operations, "run_cmd", lambda cmd, input_text=None, discard_stdout=False: spec)
+    monkeypatch.setattr(
+        p4_operations, "run_cmd_silent", lambda cmd, input_text=None: written.append(input_text)
+    )
+
+    p4_operations.map_single_depot("//depot/a/file.mk")
+
+    assert len(written) == 1
+    assert written[0].splitlines()[-2:] == [
+        "\t-//depot/a/... //demo/depot/a/...",
+        "\t//depot/a/file.mk\t//demo/depot/a/file.mk",
+    ]
+
+
+def test_map_single_depot_rewrites_spec_when_path_is_excluded(monkeypatch):
+    spec = (
+        "Client: demo\n\nView:\n"
+        "\t//depot/a/file.mk //demo/depot/a/file.mk\n"
+        "\t-//depot/a/file.mk //demo/depot/a/file.mk"
+    )
+    written = []
+
+    def fake_run_cmd(cmd, input_text=None, discard_stdout=False):
+        return spec
+
+    monkeypatch.setattr(p4_operations, "get_client_name", lambda: "demo")
+    monkeypatch.setattr(p4_operations, "run_cmd", fake_run_cmd)
+    monkeypatch.setattr(
+        p4_operations, "run_cmd_silent", lambda cmd, input_text=None: written.append(input_text)
+    )
+
+    p4_operations.map_single_depot("//depot/a/file.mk")
+
+    assert len(written) == 1
+    assert "-//depot/a/file.mk" not in written[0]
+    assert written[0].endswith("\t//depot/a/file.mk\t//demo/depot/a/file.mk")
+
+
+def test_validate_depot_path_is_cached_until_reset_but_bulk_misses_are_not(monkeypatch):
+    calls = []
+
+    class FakeClient:
+        def run_marshalled(self, args, arg_lines=None):
+            calls.append(args[1])
+            return [{"code": "stat", "depotFile": args[1]}]
+
+        def files_many(self, depot_paths):
+            calls.append(list(depot_paths))
+            return {path: False for path in depot_paths}
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+
+    assert p4_operations.validate_depot_path("//depot/a.mk") is True
+    assert p4_operations.validate_depot_paths_bulk(["//depot/a.mk", "//depot/b.mk"]) == {
+        "//depot/a.mk": True,
+        "//depot/b.mk": False,
+    }
+    # A batched miss is not cached, so the single check asks P4 itself
+    assert p4_operations.validate_depot_path("//depot/b.mk") is True
+
+    p4_operations.reset_p4_caches()
+    assert p4_operations.validate_depot_path("//depot/a.mk") is True
+    assert calls == ["//depot/a.mk", ["//depot/b.mk"], "//depot/b.mk", "//depot/a.mk"]
+
+
+def test_reset_p4_caches_keeps_integration_sources(monkeypatch):
+    p4_operations._INTEGRATION_SRC_CACHE["//depot/rel/device_common.mk"] = "//depot/flumen/device_common.mk"
+    p4_operations._VALIDATE_CACHE["//depot/rel/device_common.mk"] = True
+
+    p4_operations.reset_p4_caches()
+
+    assert p4_operations._VALIDATE_CACHE == {}
+    assert p4_operations.get_integration_source_depot_path(
+        "//depot/rel/device_common.mk", None
+    ) == "//depot/flumen/device_common.mk"
+
+    p4_operations.clear_integration_cache()
+    assert p4_operations._INTEGRATION_SRC_CACHE == {}
+
+
+def test_get_integration_sources_bulk_runs_one_filelog_for_independent_paths(monkeypatch):
+    batches = []
+
+    class FakeClient:
+        def filelog_records_many(self, depot_paths):
+            batches.append(list(depot_paths))
+            return [
+                {"code": "stat", "depotFile": "//depot/rel/device_common.mk",
+                 "how0,0": "branch from", "file0,0": "//depot/flumen/device_common.mk"},
+                {"code": "stat", "depotFile": "//depot/rel/Android.mk"},
+            ]
+
+        def filelog_records(self, depot_path):
+            return [{"code": "error", "data": "no such file(s)."}]
+
+    monkeypatch.setattr(p4_operations, "get_default_p4_client", lambda: FakeClient())
+    p4_operations._INTEGRATION_SRC_CACHE["//depot/cached.mk"] = "//depot/cached_src.mk"
+
+    sources = p4_operations.get_integration_sources_bulk([
+        "//depot/rel/device_common.mk",
+        "//depot/rel/Android.mk",
+        "//depot/cached.mk",
+        "//depot/missing.mk",
+        "",
+    ])
+
+    assert sources == {
+        "//depot/rel/device_common.mk": "//depot/flumen/device_common.mk",
+        "//depot/rel/Android.mk": None,
+        "//depot/cached.mk": "//depot/cached_src.mk",
+        "//depot/missing.mk": None,
+    }
+    assert batches == [[
+        "//depot/rel/device_common.mk#1",
+        "//depot/rel/Android.mk#1",
+        "//depot/missing.mk#1",
+    ]]
+
+
+def test_log_branches_joins_branch_lines():
+    messages = []
+
+    branches = p4_operations.Branches("VINCE", "", "FLUMEN", "")
+    p4_operations._log_branches(messages.append, "INPUT", branches, "(empty)")
+
+    assert messages == [
+        "[INPUT] VINCE: VINCE\n[INPUT] BENI: (empty)\n[INPUT] FLUMEN: FLUMEN\n[INPUT] REL: (empty)"
+    ]
+
+
+def test_validate_device_common_mk_path_shares_existence_cache(monkeypatch):
+    calls = []
+
+    def fake_run(*args):
+        calls.append(args)
+        return [{"code": "stat", "depotFile": args[1]}]
+
+    monkeypatch.setattr(p4_operations, "p4_run", fake_run)
+
+    assert p4_operations.validate_depot_path("//depot/a/device_common.mk") is True
+    assert p4_operations.validate_device_common_mk_path("//depot/a/device_common.mk") == (True, True)
+    assert p4_operations.validate_device_common_mk_path("//depot/a/other.mk") == (True, False)
+    assert calls == [("files", "//depot/a/device_common.mk"), ("files", "//depot/a/other.mk")]